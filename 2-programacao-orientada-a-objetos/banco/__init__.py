@@ -0,0 +1,95 @@
+"""
+Núcleo do sistema bancário.
+
+As classes de domínio são carregadas junto com o pacote; validação,
+armazenamento, particionamento, encargos, antifraude, eventos, listagem e
+a interface de menu só são importados no primeiro acesso, para que
+workers sem interface iniciem rápido.
+"""
+
+from importlib import import_module
+
+from .dominio import (
+    Cliente,
+    Conta,
+    ContaCorrente,
+    Deposito,
+    Encargo,
+    EstornoTransferencia,
+    Historico,
+    Inspetor,
+    JurosChequeEspecial,
+    Ouvinte,
+    PessoaFisica,
+    Saque,
+    TarifaManutencao,
+    Transacao,
+    Transferencia,
+    TransferenciaEnviada,
+    TransferenciaRecebida,
+)
+
+_CARREGAMENTO_TARDIO = {
+    "CacheExtratos": "armazenamento",
+    "ErroValidacao": "validacao",
+    "converter_data": "validacao",
+    "gerar_cpf": "validacao",
+    "normalizar_cpf": "validacao",
+    "normalizar_endereco": "validacao",
+    "validar_cpf": "validacao",
+    "validar_cpfs_em_lote": "validacao",
+    "validar_registro": "validacao",
+    "validar_registros": "validacao",
+    "validar_registros_em_lote": "validacao",
+    "BancoParticionado": "particionamento",
+    "Particao": "particionamento",
+    "MotorEncargos": "encargos",
+    "RegraEncargo": "encargos",
+    "JurosSobreSaldoDevedor": "encargos",
+    "TarifaDiaria": "encargos",
+    "MonitorFraude": "antifraude",
+    "RegraFraude": "antifraude",
+    "SaquesProximosDoLimite": "antifraude",
+    "DepositosFracionados": "antifraude",
+    "VolumeDeSaques": "antifraude",
+    "Assinatura": "eventos",
+    "Evento": "eventos",
+    "FluxoEventos": "eventos",
+    "IndiceContas": "listagem",
+    "ListaOrdenada": "listagem",
+}
+
+__all__ = [
+    "Cliente",
+    "Conta",
+    "ContaCorrente",
+    "Deposito",
+    "Encargo",
+    "EstornoTransferencia",
+    "Historico",
+    "Inspetor",
+    "JurosChequeEspecial",
+    "Ouvinte",
+    "PessoaFisica",
+    "Saque",
+    "TarifaManutencao",
+    "Transacao",
+    "Transferencia",
+    "TransferenciaEnviada",
+    "TransferenciaRecebida",
+]
+
+
+def __getattr__(nome: str):
+    modulo = _CARREGAMENTO_TARDIO.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    # Os nomes tardios ficam fora de __all__: "from banco import *" não deve importar os módulos opcionais
+    return sorted([*__all__, *_CARREGAMENTO_TARDIO])
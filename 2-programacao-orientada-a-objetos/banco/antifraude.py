@@ -0,0 +1,310 @@
+"""
+Detecção de fraude em tempo real no caminho das transações.
+
+Cada regra mantém, por conta, uma janela deslizante de contagens e somas
+em baldes circulares, com custo O(1) amortizado por evento. O
+MonitorFraude é registrado como inspetor em ``Transacao`` e pode apenas
+sinalizar ou também bloquear as transações suspeitas. A avaliação antes
+da transação só consulta as janelas (expirando o que saiu delas); a
+transação entra nelas apenas depois de efetivada, então tentativas
+recusadas ou bloqueadas não contam.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Type
+
+from .dominio import Conta, Deposito, Inspetor, Saque, Transacao
+
+
+class JanelaDeslizante:
+    """Contagem e soma de eventos nos últimos ``duracao`` segundos."""
+
+    __slots__ = ("_largura", "_contagens", "_somas", "_ultimo_balde", "contagem", "soma")
+
+    def __init__(self, duracao: float, baldes: int = 32):
+        self._largura = duracao / baldes
+        self._contagens = [0] * baldes
+        self._somas = [0.0] * baldes
+        self._ultimo_balde = 0
+        self.contagem = 0
+        self.soma = 0.0
+
+    def avancar(self, instante: float) -> None:
+        """
+        Expira os baldes que saíram da janela até o instante, sem registrar evento.
+
+        Args:
+            instante: Momento atual, em segundos
+        """
+        balde = int(instante // self._largura)
+        if balde <= self._ultimo_balde:
+            return
+
+        total_baldes = len(self._contagens)
+        if balde - self._ultimo_balde >= total_baldes:
+            self._contagens = [0] * total_baldes
+            self._somas = [0.0] * total_baldes
+            self.contagem = 0
+            self.soma = 0.0
+        else:
+            for expirado in range(self._ultimo_balde + 1, balde + 1):
+                posicao = expirado % total_baldes
+                self.contagem -= self._contagens[posicao]
+                self.soma -= self._somas[posicao]
+                self._contagens[posicao] = 0
+                self._somas[posicao] = 0.0
+        self._ultimo_balde = balde
+
+    def consultar(self, instante: float) -> Tuple[int, float]:
+        """
+        Retorna a contagem e a soma da janela no instante, sem registrar evento.
+
+        Args:
+            instante: Momento da consulta, em segundos
+
+        Returns:
+            Contagem e soma dos eventos que estão na janela
+        """
+        self.avancar(instante)
+        return self.contagem, self.soma
+
+    def registrar(self, instante: float, valor: float) -> None:
+        """
+        Adiciona um evento à janela, expirando os baldes que saíram dela.
+
+        Args:
+            instante: Momento do evento, em segundos
+            valor: Valor somado na janela
+        """
+        self.avancar(instante)
+        posicao = self._ultimo_balde % len(self._contagens)
+        self._contagens[posicao] += 1
+        self._somas[posicao] += valor
+        self.contagem += 1
+        self.soma += valor
+
+
+class RegraFraude(ABC):
+    """
+    Classe base das regras: janelas por conta e ação ao disparar.
+
+    ``tipos`` lista as transações que a regra observa; o monitor só consulta
+    a regra para esses tipos. ``avaliar`` e ``registrar`` são chamados apenas
+    para transações em que ``relevante`` retornou True.
+    """
+
+    nome = "regra"
+    tipos: Tuple[Type[Transacao], ...] = ()
+
+    def __init__(self, janela: float, bloquear: bool = False):
+        self.janela = janela
+        self.bloquear = bloquear
+        self._janelas: Dict[int, JanelaDeslizante] = {}
+
+    def _consultar(self, conta: Conta, instante: float) -> Tuple[int, float]:
+        janela = self._janelas.get(conta.numero)
+        return (0, 0.0) if janela is None else janela.consultar(instante)
+
+    def registrar(self, conta: Conta, transacao: Transacao, instante: float) -> None:
+        """Adiciona uma transação relevante e efetivada à janela da conta."""
+        janela = self._janelas.get(conta.numero)
+        if janela is None:
+            janela = self._janelas[conta.numero] = JanelaDeslizante(self.janela)
+        janela.registrar(instante, transacao.valor)
+
+    @abstractmethod
+    def relevante(self, conta: Conta, transacao: Transacao) -> bool:
+        """Retorna True se a transação entra na janela desta regra."""
+        pass
+
+    @abstractmethod
+    def avaliar(self, conta: Conta, transacao: Transacao, instante: float) -> bool:
+        """Retorna True se a regra dispararia com a transação relevante, sem registrá-la."""
+        pass
+
+
+class SaquesProximosDoLimite(RegraFraude):
+    """Muitos saques próximos do limite por saque em pouco tempo."""
+
+    nome = "saques_proximos_do_limite"
+    tipos = (Saque,)
+
+    def __init__(self, quantidade: int = 3, fracao: float = 0.9, janela: float = 600, bloquear: bool = False):
+        super().__init__(janela, bloquear)
+        self.quantidade = quantidade
+        self.fracao = fracao
+
+    def relevante(self, conta: Conta, transacao: Transacao) -> bool:
+        limite = getattr(conta, "limite", None)
+        return limite is not None and transacao.valor >= limite * self.fracao
+
+    def avaliar(self, conta: Conta, transacao: Transacao, instante: float) -> bool:
+        contagem, _ = self._consultar(conta, instante)
+        return contagem + 1 >= self.quantidade
+
+
+class DepositosFracionados(RegraFraude):
+    """Depósitos repetidos logo abaixo de um limiar de comunicação obrigatória."""
+
+    nome = "depositos_fracionados"
+    tipos = (Deposito,)
+
+    def __init__(
+        self,
+        limiar: float = 10_000,
+        margem: float = 0.1,
+        quantidade: int = 3,
+        janela: float = 86_400,
+        bloquear: bool = False,
+    ):
+        super().__init__(janela, bloquear)
+        self.limiar = limiar
+        self.minimo = limiar * (1 - margem)
+        self.quantidade = quantidade
+
+    def relevante(self, conta: Conta, transacao: Transacao) -> bool:
+        return self.minimo <= transacao.valor < self.limiar
+
+    def avaliar(self, conta: Conta, transacao: Transacao, instante: float) -> bool:
+        contagem, _ = self._consultar(conta, instante)
+        return contagem + 1 >= self.quantidade
+
+
+class VolumeDeSaques(RegraFraude):
+    """Soma de saques acima de um valor máximo dentro da janela."""
+
+    nome = "volume_de_saques"
+    tipos = (Saque,)
+
+    def __init__(self, valor_maximo: float = 5_000, janela: float = 3_600, bloquear: bool = True):
+        super().__init__(janela, bloquear)
+        self.valor_maximo = valor_maximo
+
+    def relevante(self, conta: Conta, transacao: Transacao) -> bool:
+        return True
+
+    def avaliar(self, conta: Conta, transacao: Transacao, instante: float) -> bool:
+        _, soma = self._consultar(conta, instante)
+        return soma + transacao.valor > self.valor_maximo
+
+
+class Alerta:
+    """Registro de uma regra disparada."""
+
+    __slots__ = ("regra", "conta", "tipo", "valor", "instante", "bloqueado")
+
+    def __init__(self, regra: str, conta: int, tipo: str, valor: float, instante: float, bloqueado: bool):
+        self.regra = regra
+        self.conta = conta
+        self.tipo = tipo
+        self.valor = valor
+        self.instante = instante
+        self.bloqueado = bloqueado
+
+    def __repr__(self) -> str:
+        return f"Alerta(regra='{self.regra}', conta={self.conta}, tipo='{self.tipo}', valor={self.valor:.2f})"
+
+
+class MonitorFraude(Inspetor):
+    """
+    Estágio de inspeção que aplica as regras a cada saque e depósito.
+
+    ``inspecionar`` avalia as regras antes da transação; ``confirmar`` registra
+    nas janelas só as transações efetivadas, reaproveitando o instante e as
+    regras relevantes da inspeção. As regras são indexadas pelo tipo da
+    transação, então regras de saque nem são consultadas em depósitos. Use
+    ``ativar``/``desativar`` para registrá-lo em ``Transacao``.
+    """
+
+    def __init__(
+        self,
+        regras: Optional[List[RegraFraude]] = None,
+        relogio: Callable[[], float] = time.monotonic,
+        max_alertas: int = 10_000,
+    ):
+        if regras is None:
+            regras = [SaquesProximosDoLimite(), DepositosFracionados(), VolumeDeSaques()]
+
+        self.regras = regras
+        self._relogio = relogio
+        self._ultima_inspecao: Optional[Tuple[Transacao, Conta, float, List[RegraFraude]]] = None
+        self.alertas: Deque[Alerta] = deque(maxlen=max_alertas)
+        self.inspecionadas = 0
+        self.bloqueadas = 0
+
+    @property
+    def regras(self) -> List[RegraFraude]:
+        """Retorna as regras aplicadas pelo monitor."""
+        return self._regras
+
+    @regras.setter
+    def regras(self, regras: List[RegraFraude]) -> None:
+        self._regras = list(regras)
+        self._regras_por_tipo: Dict[type, List[RegraFraude]] = {}
+        for regra in self._regras:
+            for tipo in regra.tipos:
+                self._regras_por_tipo.setdefault(tipo, []).append(regra)
+
+    def _relevantes(self, conta: Conta, transacao: Transacao) -> List[RegraFraude]:
+        return [regra for regra in self._regras_por_tipo.get(type(transacao), ()) if regra.relevante(conta, transacao)]
+
+    def ativar(self) -> 'MonitorFraude':
+        """Registra o monitor no caminho das transações."""
+        Transacao.adicionar_inspetor(self)
+        return self
+
+    def desativar(self) -> None:
+        """Remove o monitor do caminho das transações."""
+        Transacao.remover_inspetor(self)
+
+    def inspecionar(self, conta: Conta, transacao: Transacao) -> bool:
+        """
+        Avalia a transação em todas as regras.
+
+        Args:
+            conta: Conta da transação
+            transacao: Saque ou depósito prestes a ser registrado
+
+        Returns:
+            False se alguma regra configurada para bloquear disparou
+        """
+        instante = self._relogio()
+        relevantes: List[RegraFraude] = []
+        self._ultima_inspecao = (transacao, conta, instante, relevantes)
+        aprovada = True
+        self.inspecionadas += 1
+
+        for regra in self._regras_por_tipo.get(type(transacao), ()):
+            if not regra.relevante(conta, transacao):
+                continue
+            relevantes.append(regra)
+            if regra.avaliar(conta, transacao, instante):
+                self.alertas.append(
+                    Alerta(regra.nome, conta.numero, type(transacao).__name__, transacao.valor, instante, regra.bloquear)
+                )
+                if regra.bloquear:
+                    aprovada = False
+
+        if not aprovada:
+            self.bloqueadas += 1
+        return aprovada
+
+    def confirmar(self, conta: Conta, transacao: Transacao) -> None:
+        """
+        Registra uma transação efetivada nas janelas das regras.
+
+        Args:
+            conta: Conta da transação
+            transacao: Saque ou depósito já registrado na conta
+        """
+        # Em geral é a transação recém-inspecionada; com workers em paralelo, recalcula
+        ultima = self._ultima_inspecao
+        if ultima is not None and ultima[0] is transacao and ultima[1] is conta:
+            instante, relevantes = ultima[2], ultima[3]
+        else:
+            instante, relevantes = self._relogio(), self._relevantes(conta, transacao)
+
+        for regra in relevantes:
+            regra.registrar(conta, transacao, instante)
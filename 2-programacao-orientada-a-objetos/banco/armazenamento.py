@@ -0,0 +1,99 @@
+"""Estruturas de armazenamento em memória usadas pelo banco."""
+
+from collections import OrderedDict
+from typing import Tuple
+
+Chave = Tuple[str, int]
+
+from .dominio import Conta, Historico
+
+
+class CacheExtratos:
+    """
+    Cache LRU limitado dos extratos já renderizados.
+
+    Cada entrada é indexada por agência e número da conta e guarda o
+    histórico renderizado e a sua versão; uma conta diferente com o mesmo
+    número (outro histórico) nunca reaproveita o texto. Quando o histórico
+    cresce, apenas as transações novas são renderizadas e anexadas ao texto
+    em cache.
+    """
+
+    def __init__(self, max_entradas: int = 1024, max_caracteres: int = 8 * 1024 * 1024):
+        self._entradas: "OrderedDict[Chave, Tuple[Historico, int, str]]" = OrderedDict()
+        self._max_entradas = max_entradas
+        self._max_caracteres = max_caracteres
+        self._caracteres = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.extensoes = 0
+        self.despejos = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    @property
+    def caracteres(self) -> int:
+        """Retorna o total de caracteres mantidos em cache."""
+        return self._caracteres
+
+    def obter(self, conta: 'Conta') -> str:
+        """
+        Retorna o relatório do histórico da conta, usando o cache quando possível.
+
+        Args:
+            conta: Conta cujo extrato será exibido
+
+        Returns:
+            Relatório formatado do histórico de transações
+        """
+        historico = conta.historico
+        versao = historico.versao
+
+        if versao == 0:
+            return historico.gerar_relatorio()
+
+        chave = (conta.agencia, conta.numero)
+        entrada = self._entradas.get(chave)
+        if entrada is not None and entrada[0] is not historico:
+            entrada = None
+
+        if entrada is not None and entrada[1] == versao:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada[2]
+
+        if entrada is not None and entrada[1] < versao:
+            # Histórico só cresce: estende o texto em vez de renderizar tudo.
+            corpo = entrada[2][: -len(Historico.RODAPE)]
+            texto = corpo + historico.renderizar_desde(entrada[1]) + Historico.RODAPE
+            self.extensoes += 1
+        else:
+            texto = historico.gerar_relatorio()
+            self.faltas += 1
+
+        self._armazenar(chave, historico, versao, texto)
+        return texto
+
+    def invalidar(self, conta: 'Conta') -> None:
+        """Remove do cache o extrato de uma conta."""
+        self._remover((conta.agencia, conta.numero))
+
+    def _remover(self, chave: Chave) -> None:
+        entrada = self._entradas.pop(chave, None)
+        if entrada is not None:
+            self._caracteres -= len(entrada[2])
+
+    def _armazenar(self, chave: Chave, historico: Historico, versao: int, texto: str) -> None:
+        self._remover(chave)
+
+        if len(texto) > self._max_caracteres:
+            return
+
+        self._entradas[chave] = (historico, versao, texto)
+        self._caracteres += len(texto)
+
+        while len(self._entradas) > self._max_entradas or self._caracteres > self._max_caracteres:
+            _, (_, _, removido) = self._entradas.popitem(last=False)
+            self._caracteres -= len(removido)
+            self.despejos += 1
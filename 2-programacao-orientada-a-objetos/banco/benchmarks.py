@@ -0,0 +1,229 @@
+"""
+Benchmarks do pacote ``banco``.
+
+Uso: python -m banco.benchmarks <nome> [...]
+"""
+
+import contextlib
+import itertools
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import Future, wait
+from datetime import date
+from typing import Dict, List, Tuple
+
+from .particionamento import BancoParticionado
+from .validacao import gerar_cpf
+
+
+def medir_vazao_particoes(
+    contagens: Tuple[int, ...] = (1, 2, 4, 8),
+    operacoes: int = 200_000,
+    numero_contas: int = 10_000,
+    usar_processos: bool = False,
+    tamanho_lote: int = 1_000,
+) -> Dict[int, float]:
+    """
+    Mede a vazão (operações por segundo) do banco particionado.
+
+    Args:
+        contagens: Números de partições a serem medidos
+        operacoes: Quantidade de depósitos disparados em cada medição
+        numero_contas: Quantidade de contas criadas antes da medição
+        usar_processos: Usa processos em vez de threads como workers
+        tamanho_lote: Depósitos por lote enviado às partições
+
+    Returns:
+        Dicionário com a vazão medida para cada número de partições
+    """
+    resultados: Dict[int, float] = {}
+
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        for total in contagens:
+            with BancoParticionado(total, usar_processos=usar_processos) as banco:
+                cpfs = [gerar_cpf(indice + 1) for indice in range(numero_contas)]
+                wait([banco.criar_cliente("Cliente", "01-01-2000", cpf, "Rua A, 1") for cpf in cpfs])
+                numeros = [futuro.result() for futuro in [banco.criar_conta(cpf) for cpf in cpfs]]
+
+                inicio = time.perf_counter()
+                futuros: List[Future] = []
+                for inicio_lote in range(0, operacoes, tamanho_lote):
+                    fim_lote = min(inicio_lote + tamanho_lote, operacoes)
+                    lote = [(numeros[indice % numero_contas], 1.0) for indice in range(inicio_lote, fim_lote)]
+                    futuros.extend(banco.depositar_em_lote(lote))
+                wait(futuros)
+                resultados[total] = operacoes / (time.perf_counter() - inicio)
+
+    return resultados
+
+
+def medir_encargos(numero_contas: int = 10_000_000, contas_lancamento: int = 100_000) -> Dict[str, float]:
+    """
+    Mede o motor de encargos: cálculo vetorizado e lançamento nos históricos.
+
+    O cálculo roda sobre arrays sintéticos com ``numero_contas`` saldos; o
+    lançamento, que cria objetos por conta, é medido sobre ``contas_lancamento``
+    contas reais e reportado por conta.
+
+    Returns:
+        Tempos do cálculo (s), contas por segundo e custo de lançamento por conta (µs)
+    """
+    from .dominio import ContaCorrente, PessoaFisica
+    from .encargos import MotorEncargos
+
+    # Sem NumPy, o motor falha primeiro, com a mensagem que explica a dependência
+    motor = MotorEncargos()
+    import numpy as np
+
+    gerador = np.random.default_rng(42)
+    saldos = np.round(gerador.normal(200.0, 800.0, numero_contas), 2)
+    limites = np.full(numero_contas, 500.0)
+
+    inicio = time.perf_counter()
+    motor.calcular(saldos, limites)
+    tempo_calculo = time.perf_counter() - inicio
+
+    cliente = PessoaFisica("Cliente", date(2000, 1, 1), gerar_cpf(1), "Rua A, 1")
+    contas = []
+    for numero, saldo in enumerate(saldos[:contas_lancamento].tolist(), 1):
+        conta = ContaCorrente(numero, cliente, limite_cheque_especial=500)
+        conta.debitar_encargo(-saldo)
+        contas.append(conta)
+
+    inicio = time.perf_counter()
+    lancamentos = motor.processar(contas)
+    tempo_lancamento = time.perf_counter() - inicio
+
+    return {
+        "calculo_s": tempo_calculo,
+        "contas_por_s": numero_contas / tempo_calculo,
+        "lancamento_us_por_conta": tempo_lancamento / len(contas) * 1e6,
+        "lancamentos": lancamentos,
+    }
+
+
+def medir_antifraude(eventos: int = 300_000, numero_contas: int = 10_000, repeticoes: int = 3) -> Dict[str, float]:
+    """
+    Mede o custo do MonitorFraude no caminho real das transações.
+
+    Cronometra ``Saque/Deposito.registrar`` com o monitor desativado e
+    ativado, com a saída padrão descartada, e reporta a diferença por
+    transação. As medições se alternam ``repeticoes`` vezes e vale o menor
+    tempo de cada lado, para reduzir o ruído. Os eventos misturam saques e
+    depósitos, parte deles perto dos limites das regras. O orçamento a 100
+    mil transações por segundo é de 10 µs por transação para todo o
+    processamento.
+
+    Returns:
+        Custo por transação sem e com o monitor (µs), o acréscimo, a fração
+        do orçamento que o acréscimo representa e os alertas gerados
+    """
+    from .antifraude import MonitorFraude
+    from .dominio import ContaCorrente, Deposito, PessoaFisica, Saque
+
+    cliente = PessoaFisica("Cliente", date(2000, 1, 1), gerar_cpf(1), "Rua A, 1")
+    modelos = [Saque(100.0), Saque(480.0), Deposito(50.0), Deposito(9_500.0), Saque(20.0), Deposito(300.0)]
+
+    def medir() -> float:
+        contas = [ContaCorrente(numero, cliente) for numero in range(1, numero_contas + 1)]
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            inicio = time.perf_counter()
+            for indice in range(eventos):
+                modelos[indice % len(modelos)].registrar(contas[indice % numero_contas])
+            return (time.perf_counter() - inicio) / eventos * 1e6
+
+    sem_monitor = com_monitor = float("inf")
+    for _ in range(repeticoes):
+        sem_monitor = min(sem_monitor, medir())
+
+        monitor = MonitorFraude(relogio=itertools.count(0, 0.001).__next__).ativar()
+        try:
+            com_monitor = min(com_monitor, medir())
+        finally:
+            monitor.desativar()
+
+    acrescimo = com_monitor - sem_monitor
+    return {
+        "sem_monitor_us": sem_monitor,
+        "com_monitor_us": com_monitor,
+        "acrescimo_us": acrescimo,
+        "fracao_orcamento": acrescimo / 10,
+        "alertas": float(len(monitor.alertas)),
+    }
+
+
+def medir_importacao(modulo: str = "banco", repeticoes: int = 5) -> Dict[str, float]:
+    """
+    Mede o tempo de importação a frio de um módulo com ``python -X importtime``.
+
+    Cada repetição roda em um interpretador novo. O tempo reportado é o
+    acumulado do próprio módulo na saída do importtime, em milissegundos.
+
+    Args:
+        modulo: Módulo a ser importado (ex.: "banco" para um worker sem menu)
+        repeticoes: Quantidade de interpretadores disparados
+
+    Returns:
+        Dicionário com o menor e o maior tempo, além dos módulos carregados
+    """
+    pasta_projeto = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    tempos: List[float] = []
+    carregados = 0
+
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            cwd=pasta_projeto,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+
+        linhas = [linha for linha in saida.splitlines() if linha.startswith("import time:") and "|" in linha]
+        carregados = len(linhas) - 1
+        for linha in linhas:
+            _, acumulado, nome = (parte.strip() for parte in linha.split(":", 1)[1].split("|"))
+            if nome == modulo:
+                tempos.append(int(acumulado) / 1000)
+
+    return {"minimo_ms": min(tempos), "maximo_ms": max(tempos), "modulos": carregados}
+
+
+def main(argv: List[str]) -> None:
+    """Executa o benchmark escolhido na linha de comando."""
+    nome = argv[0] if argv else ""
+
+    if nome == "particoes":
+        for total, vazao in medir_vazao_particoes(usar_processos="--processos" in argv).items():
+            print(f"{total} partição(ões):\t{vazao:,.0f} op/s")
+
+    elif nome == "encargos":
+        resultado = medir_encargos()
+        print(f"Cálculo:\t{resultado['calculo_s']:.3f} s ({resultado['contas_por_s']:,.0f} contas/s)")
+        print(f"Lançamento:\t{resultado['lancamento_us_por_conta']:.2f} µs/conta ({resultado['lancamentos']} lançamentos)")
+
+    elif nome == "antifraude":
+        resultado = medir_antifraude()
+        print(f"Sem monitor:\t{resultado['sem_monitor_us']:.2f} µs/transação")
+        print(f"Com monitor:\t{resultado['com_monitor_us']:.2f} µs/transação")
+        print(
+            f"Acréscimo:\t{resultado['acrescimo_us']:.2f} µs/transação"
+            f" ({resultado['fracao_orcamento']:.0%} do orçamento a 100k tx/s)"
+        )
+
+    elif nome == "importacao":
+        for modulo in argv[1:] or ["banco", "banco.ui"]:
+            resultado = medir_importacao(modulo)
+            print(
+                f"{modulo}:\t{resultado['minimo_ms']:.2f}-{resultado['maximo_ms']:.2f} ms"
+                f"\t({resultado['modulos']} módulos)"
+            )
+
+    else:
+        print("Uso: python -m banco.benchmarks {particoes [--processos] | encargos | antifraude | importacao [modulo ...]}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,549 @@
+"""Classes de domínio do banco: clientes, contas, histórico e transações."""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Optional
+
+
+class Ouvinte(ABC):
+    """Classe abstrata para quem recebe os eventos de criação e de transações."""
+
+    @abstractmethod
+    def publicar(self, tipo: str, dados: dict) -> None:
+        """Recebe um evento do domínio."""
+        pass
+
+
+_ouvintes: List[Ouvinte] = []
+
+
+def adicionar_ouvinte(ouvinte: Ouvinte) -> None:
+    """Passa a enviar os eventos do domínio para um ouvinte."""
+    global _ouvintes
+    _ouvintes = _ouvintes + [ouvinte]
+
+
+def remover_ouvinte(ouvinte: Ouvinte) -> None:
+    """Deixa de enviar os eventos do domínio para um ouvinte."""
+    global _ouvintes
+    _ouvintes = [item for item in _ouvintes if item is not ouvinte]
+
+
+def _notificar(tipo: str, dados: dict) -> None:
+    for ouvinte in _ouvintes:
+        ouvinte.publicar(tipo, dados)
+
+
+class Cliente:
+    """Classe que representa um cliente do banco."""
+
+    def __init__(self, endereco: str):
+        self.endereco = endereco
+        self.contas: List['Conta'] = []
+
+    def realizar_transacao(self, conta: 'Conta', transacao: 'Transacao') -> None:
+        """Realiza uma transação em uma conta."""
+        transacao.registrar(conta)
+
+    def adicionar_conta(self, conta: 'Conta') -> None:
+        """Adiciona uma conta ao cliente."""
+        self.contas.append(conta)
+
+
+class PessoaFisica(Cliente):
+    """Classe que representa uma pessoa física como cliente do banco."""
+
+    def __init__(self, nome: str, data_nascimento: date, cpf: str, endereco: str):
+        super().__init__(endereco)
+        self.nome = nome
+        self.data_nascimento = data_nascimento
+        self.cpf = cpf
+
+        if _ouvintes:
+            _notificar("cliente_criado", {"cpf": cpf, "nome": nome})
+
+    def __repr__(self) -> str:
+        return f"PessoaFisica(nome='{self.nome}', cpf='{self.cpf}')"
+
+
+class Conta:
+    """Classe que representa uma conta bancária."""
+
+    def __init__(self, numero: int, cliente: Cliente):
+        self._saldo = 0.0
+        self._numero = numero
+        self._agencia = "0001"
+        self._cliente = cliente
+        self._historico = Historico(numero)
+
+        if _ouvintes:
+            _notificar(
+                "conta_criada",
+                {"conta": numero, "agencia": self._agencia, "cpf": getattr(cliente, "cpf", None)},
+            )
+
+    @classmethod
+    def nova_conta(cls, cliente: Cliente, numero: int) -> 'Conta':
+        """Método factory para criar uma nova conta."""
+        return cls(numero, cliente)
+
+    @property
+    def saldo(self) -> float:
+        """Retorna o saldo atual da conta."""
+        return self._saldo
+
+    @property
+    def numero(self) -> int:
+        """Retorna o número da conta."""
+        return self._numero
+
+    @property
+    def agencia(self) -> str:
+        """Retorna a agência da conta."""
+        return self._agencia
+
+    @property
+    def cliente(self) -> Cliente:
+        """Retorna o cliente titular da conta."""
+        return self._cliente
+
+    @property
+    def historico(self) -> 'Historico':
+        """Retorna o histórico de transações da conta."""
+        return self._historico
+
+    @property
+    def saldo_disponivel(self) -> float:
+        """Retorna o valor disponível para saque."""
+        return self._saldo
+
+    def sacar(self, valor: float) -> bool:
+        """
+        Realiza um saque na conta.
+
+        Args:
+            valor: Valor a ser sacado
+
+        Returns:
+            True se o saque foi bem-sucedido, False caso contrário
+        """
+        saldo = self.saldo_disponivel
+        excedeu_saldo = valor > saldo
+
+        if excedeu_saldo:
+            print("\n@@@ Operação falhou! Você não tem saldo suficiente. @@@")
+            return False
+
+        if valor <= 0:
+            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            return False
+
+        self._saldo -= valor
+        print("\n=== Saque realizado com sucesso! ===")
+        return True
+
+    def depositar(self, valor: float) -> bool:
+        """
+        Realiza um depósito na conta.
+
+        Args:
+            valor: Valor a ser depositado
+
+        Returns:
+            True se o depósito foi bem-sucedido, False caso contrário
+        """
+        if valor <= 0:
+            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            return False
+
+        self._saldo += valor
+        print("\n=== Depósito realizado com sucesso! ===")
+        return True
+
+    def debitar_encargo(self, valor: float) -> None:
+        """
+        Debita um encargo cobrado pelo banco, sem as regras de saque.
+
+        O saldo pode ficar negativo além do limite do cheque especial.
+
+        Args:
+            valor: Valor a ser debitado
+        """
+        self._saldo -= valor
+
+    def debitar_transferencia(self, valor: float) -> bool:
+        """
+        Debita o valor enviado em uma transferência, sem as regras de saque.
+
+        Não conta como saque nem respeita o limite por saque; exige apenas
+        valor positivo e saldo disponível.
+
+        Args:
+            valor: Valor a ser debitado
+
+        Returns:
+            True se o débito foi realizado, False caso contrário
+        """
+        if valor <= 0 or valor > self.saldo_disponivel:
+            return False
+
+        self._saldo -= valor
+        return True
+
+    def creditar_transferencia(self, valor: float) -> bool:
+        """
+        Credita o valor recebido (ou estornado) em uma transferência.
+
+        Args:
+            valor: Valor a ser creditado
+
+        Returns:
+            True se o crédito foi realizado, False caso contrário
+        """
+        if valor <= 0:
+            return False
+
+        self._saldo += valor
+        return True
+
+
+class ContaCorrente(Conta):
+    """Classe que representa uma conta corrente com limite de saque."""
+
+    def __init__(
+        self,
+        numero: int,
+        cliente: Cliente,
+        limite: float = 500,
+        limite_saques: int = 3,
+        limite_cheque_especial: float = 0,
+    ):
+        super().__init__(numero, cliente)
+        self._limite = limite
+        self._limite_saques = limite_saques
+        self._limite_cheque_especial = limite_cheque_especial
+
+    @property
+    def limite(self) -> float:
+        """Retorna o limite de saque por transação."""
+        return self._limite
+
+    @property
+    def limite_saques(self) -> int:
+        """Retorna o limite de saques diários."""
+        return self._limite_saques
+
+    @property
+    def limite_cheque_especial(self) -> float:
+        """Retorna quanto o saldo pode ficar negativo em saques."""
+        return self._limite_cheque_especial
+
+    @property
+    def saldo_disponivel(self) -> float:
+        """Retorna o saldo somado ao limite do cheque especial."""
+        return self._saldo + self._limite_cheque_especial
+
+    def sacar(self, valor: float) -> bool:
+        """
+        Realiza um saque na conta corrente respeitando limites.
+
+        Args:
+            valor: Valor a ser sacado
+
+        Returns:
+            True se o saque foi bem-sucedido, False caso contrário
+        """
+        numero_saques = len(
+            [transacao for transacao in self.historico.transacoes if transacao["tipo"] == Saque.__name__]
+        )
+
+        excedeu_limite = valor > self._limite
+        excedeu_saques = numero_saques >= self._limite_saques
+
+        if excedeu_limite:
+            print("\n@@@ Operação falhou! O valor do saque excede o limite. @@@")
+            return False
+
+        if excedeu_saques:
+            print("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
+            return False
+
+        return super().sacar(valor)
+
+    def __str__(self) -> str:
+        return f"""\
+            Agência:\t{self.agencia}
+            C/C:\t\t{self.numero}
+            Titular:\t{self.cliente.nome}
+        """
+
+    def __repr__(self) -> str:
+        return f"ContaCorrente(numero={self.numero}, agencia='{self.agencia}', saldo={self.saldo:.2f})"
+
+
+class Historico:
+    """Classe que representa o histórico de transações de uma conta."""
+
+    CABECALHO = "\n========== HISTÓRICO DE TRANSAÇÕES ==========\n"
+    RODAPE = "\n============================================\n"
+
+    def __init__(self, numero_conta: Optional[int] = None):
+        self._transacoes: List[dict] = []
+        self._numero_conta = numero_conta
+
+    @property
+    def transacoes(self) -> List[dict]:
+        """Retorna a lista de transações."""
+        return self._transacoes
+
+    @property
+    def versao(self) -> int:
+        """Retorna a versão do histórico (cresce a cada transação adicionada)."""
+        return len(self._transacoes)
+
+    def adicionar_transacao(self, transacao: 'Transacao', data: Optional[str] = None) -> None:
+        """
+        Adiciona uma transação ao histórico.
+
+        Args:
+            transacao: Transação a ser adicionada
+            data: Data já formatada; se omitida, usa o momento atual
+        """
+        registro = {
+            "tipo": transacao.__class__.__name__,
+            "valor": transacao.valor,
+            "data": data or datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+        }
+        self._transacoes.append(registro)
+
+        if _ouvintes:
+            _notificar("transacao", {"conta": self._numero_conta, "versao": len(self._transacoes), **registro})
+
+    @staticmethod
+    def renderizar_transacao(transacao: dict) -> str:
+        """Renderiza uma única transação no formato do relatório."""
+        return (
+            f"\n{transacao['tipo']}:\n"
+            f"  Valor: R$ {transacao['valor']:.2f}\n"
+            f"  Data: {transacao['data']}\n"
+        )
+
+    def renderizar_desde(self, versao: int) -> str:
+        """
+        Renderiza apenas as transações adicionadas a partir de uma versão.
+
+        Args:
+            versao: Versão do histórico já renderizada anteriormente
+
+        Returns:
+            Texto das transações novas, sem cabeçalho nem rodapé
+        """
+        return "".join(self.renderizar_transacao(transacao) for transacao in self._transacoes[versao:])
+
+    def gerar_relatorio(self) -> str:
+        """Gera um relatório formatado do histórico de transações."""
+        if not self._transacoes:
+            return "Nenhuma transação realizada."
+
+        return self.CABECALHO + self.renderizar_desde(0) + self.RODAPE
+
+
+class Transacao(ABC):
+    """Classe abstrata para representar uma transação bancária."""
+
+    _inspetores: List['Inspetor'] = []
+
+    @classmethod
+    def adicionar_inspetor(cls, inspetor: 'Inspetor') -> None:
+        """Adiciona um inspetor consultado antes de cada saque ou depósito."""
+        Transacao._inspetores = Transacao._inspetores + [inspetor]
+
+    @classmethod
+    def remover_inspetor(cls, inspetor: 'Inspetor') -> None:
+        """Remove um inspetor adicionado anteriormente."""
+        Transacao._inspetores = [item for item in Transacao._inspetores if item is not inspetor]
+
+    def aprovada(self, conta: 'Conta') -> bool:
+        """
+        Consulta os inspetores registrados sobre esta transação.
+
+        Args:
+            conta: Conta onde a transação será realizada
+
+        Returns:
+            True se nenhum inspetor bloqueou a transação
+        """
+        aprovada = True
+        for inspetor in Transacao._inspetores:
+            aprovada = inspetor.inspecionar(conta, self) and aprovada
+
+        if not aprovada:
+            print("\n@@@ Operação bloqueada pela análise de segurança! @@@")
+        return aprovada
+
+    def confirmar(self, conta: 'Conta') -> None:
+        """Avisa os inspetores registrados de que a transação foi efetivada na conta."""
+        for inspetor in Transacao._inspetores:
+            inspetor.confirmar(conta, self)
+
+    @property
+    @abstractmethod
+    def valor(self):
+        """Retorna o valor da transação."""
+        pass
+
+    @abstractmethod
+    def registrar(self, conta):
+        """Registra a transação na conta especificada."""
+        pass
+
+
+class Inspetor(ABC):
+    """Classe abstrata para estágios que inspecionam transações antes do registro."""
+
+    @abstractmethod
+    def inspecionar(self, conta: Conta, transacao: Transacao) -> bool:
+        """Retorna False para bloquear a transação."""
+        pass
+
+    def confirmar(self, conta: Conta, transacao: Transacao) -> None:
+        """Recebe a transação depois de efetivada; transações recusadas não chegam aqui."""
+        pass
+
+
+class Saque(Transacao):
+    """Classe que representa uma transação de saque."""
+
+    def __init__(self, valor: float):
+        self._valor = valor
+
+    @property
+    def valor(self) -> float:
+        """Retorna o valor do saque."""
+        return self._valor
+
+    def registrar(self, conta: Conta) -> None:
+        """
+        Registra o saque na conta.
+
+        Args:
+            conta: Conta onde o saque será realizado
+        """
+        if self._inspetores and not self.aprovada(conta):
+            return
+
+        sucesso_transacao = conta.sacar(self.valor)
+
+        if sucesso_transacao:
+            if self._inspetores:
+                self.confirmar(conta)
+            conta.historico.adicionar_transacao(self)
+
+
+class Deposito(Transacao):
+    """Classe que representa uma transação de depósito."""
+
+    def __init__(self, valor: float):
+        self._valor = valor
+
+    @property
+    def valor(self) -> float:
+        """Retorna o valor do depósito."""
+        return self._valor
+
+    def registrar(self, conta: Conta) -> None:
+        """
+        Registra o depósito na conta.
+
+        Args:
+            conta: Conta onde o depósito será realizado
+        """
+        if self._inspetores and not self.aprovada(conta):
+            return
+
+        sucesso_transacao = conta.depositar(self.valor)
+
+        if sucesso_transacao:
+            if self._inspetores:
+                self.confirmar(conta)
+            conta.historico.adicionar_transacao(self)
+
+
+class Encargo(Transacao):
+    """Classe base para débitos lançados pelo próprio banco."""
+
+    def __init__(self, valor: float, data: Optional[str] = None):
+        self._valor = valor
+        self._data = data
+
+    @property
+    def valor(self) -> float:
+        """Retorna o valor do encargo."""
+        return self._valor
+
+    def registrar(self, conta: Conta) -> None:
+        """
+        Debita o encargo na conta e o adiciona ao histórico.
+
+        Args:
+            conta: Conta onde o encargo será lançado
+        """
+        conta.debitar_encargo(self.valor)
+        conta.historico.adicionar_transacao(self, self._data)
+
+
+class JurosChequeEspecial(Encargo):
+    """Classe que representa os juros cobrados sobre o saldo devedor."""
+
+
+class TarifaManutencao(Encargo):
+    """Classe que representa a tarifa de manutenção da conta."""
+
+
+class Transferencia(Transacao):
+    """
+    Classe base para os lançamentos de uma transferência entre contas.
+
+    São movimentações internas do banco: não passam pelos inspetores nem
+    pelas regras de saque do cliente.
+    """
+
+    def __init__(self, valor: float):
+        self._valor = valor
+
+    @property
+    def valor(self) -> float:
+        """Retorna o valor transferido."""
+        return self._valor
+
+
+class TransferenciaEnviada(Transferencia):
+    """Classe que representa o débito de uma transferência na conta de origem."""
+
+    def registrar(self, conta: Conta) -> None:
+        """
+        Debita a transferência na conta de origem.
+
+        Args:
+            conta: Conta de origem
+        """
+        if conta.debitar_transferencia(self.valor):
+            conta.historico.adicionar_transacao(self)
+
+
+class TransferenciaRecebida(Transferencia):
+    """Classe que representa o crédito de uma transferência na conta de destino."""
+
+    def registrar(self, conta: Conta) -> None:
+        """
+        Credita a transferência na conta de destino.
+
+        Args:
+            conta: Conta de destino
+        """
+        if conta.creditar_transferencia(self.valor):
+            conta.historico.adicionar_transacao(self)
+
+
+class EstornoTransferencia(TransferenciaRecebida):
+    """Classe que representa a devolução à origem de uma transferência que não foi creditada."""
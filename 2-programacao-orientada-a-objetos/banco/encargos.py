@@ -0,0 +1,139 @@
+"""
+Motor de encargos noturnos do cheque especial.
+
+As regras são calculadas em uma única passada vetorizada sobre os saldos de
+todas as contas e os valores diferentes de zero são lançados nos históricos
+em lote. Requer NumPy: o módulo importa sem ele, mas criar o MotorEncargos
+lança ImportError com uma mensagem explicando a dependência.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Sequence, Type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .dominio import ContaCorrente, Encargo, JurosChequeEspecial, TarifaManutencao
+
+
+class RegraEncargo(ABC):
+    """Classe abstrata para uma regra de cálculo de encargos."""
+
+    tipo: Type[Encargo] = Encargo
+
+    @abstractmethod
+    def calcular(self, saldos: 'np.ndarray', limites: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calcula o encargo de cada conta.
+
+        Args:
+            saldos: Saldos das contas
+            limites: Limites de cheque especial das contas
+
+        Returns:
+            Valores a debitar, um por conta (zero quando não há cobrança)
+        """
+        pass
+
+
+class JurosSobreSaldoDevedor(RegraEncargo):
+    """
+    Juros diários sobre a parte negativa do saldo.
+
+    A dívida dentro do limite do cheque especial paga a taxa normal; a parte
+    que passa do limite paga a taxa de excedente.
+    """
+
+    tipo = JurosChequeEspecial
+
+    def __init__(self, taxa_mensal: float = 0.08, taxa_mensal_excedente: float = 0.12, dias_no_mes: int = 30):
+        self.taxa_diaria = (1 + taxa_mensal) ** (1 / dias_no_mes) - 1
+        self.taxa_diaria_excedente = (1 + taxa_mensal_excedente) ** (1 / dias_no_mes) - 1
+
+    def calcular(self, saldos: 'np.ndarray', limites: 'np.ndarray') -> 'np.ndarray':
+        divida = np.maximum(-saldos, 0.0)
+        dentro_do_limite = np.minimum(divida, limites)
+        excedente = divida - dentro_do_limite
+        return np.round(dentro_do_limite * self.taxa_diaria + excedente * self.taxa_diaria_excedente, 2)
+
+
+class TarifaDiaria(RegraEncargo):
+    """
+    Tarifa de manutenção fixa, isenta para saldos a partir de um mínimo.
+
+    Só é cobrada quando cabe no saldo disponível (saldo mais o limite do
+    cheque especial), para nunca levar a conta a um saldo negativo não autorizado.
+    """
+
+    tipo = TarifaManutencao
+
+    def __init__(self, valor: float = 0.50, saldo_isencao: Optional[float] = 1000.0):
+        self.valor = valor
+        self.saldo_isencao = saldo_isencao
+
+    def calcular(self, saldos: 'np.ndarray', limites: 'np.ndarray') -> 'np.ndarray':
+        cobrar = saldos + limites >= self.valor
+        if self.saldo_isencao is not None:
+            cobrar &= saldos < self.saldo_isencao
+
+        return np.where(cobrar, self.valor, 0.0)
+
+
+class MotorEncargos:
+    """Aplica um conjunto de regras de encargos sobre muitas contas de uma vez."""
+
+    def __init__(self, regras: Optional[List[RegraEncargo]] = None):
+        if np is None:
+            raise ImportError("O motor de encargos requer o NumPy instalado (pip install numpy).")
+
+        self.regras = regras if regras is not None else [JurosSobreSaldoDevedor(), TarifaDiaria()]
+
+    def calcular(self, saldos: 'np.ndarray', limites: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calcula todas as regras a partir dos saldos de abertura.
+
+        As regras são aplicadas em ordem e cada uma vê o saldo já descontado
+        dos encargos das anteriores.
+
+        Args:
+            saldos: Saldos das contas
+            limites: Limites de cheque especial das contas
+
+        Returns:
+            Matriz (regras x contas) com os valores a debitar
+        """
+        encargos = np.empty((len(self.regras), saldos.shape[0]))
+        for indice, regra in enumerate(self.regras):
+            encargos[indice] = regra.calcular(saldos, limites)
+            saldos = saldos - encargos[indice]
+        return encargos
+
+    def processar(self, contas: Sequence[ContaCorrente], data: Optional[datetime] = None) -> int:
+        """
+        Calcula e lança os encargos do dia nas contas.
+
+        Args:
+            contas: Contas correntes a processar
+            data: Data do lançamento; se omitida, usa o momento atual
+
+        Returns:
+            Quantidade de lançamentos realizados
+        """
+        total = len(contas)
+        saldos = np.fromiter((conta.saldo for conta in contas), dtype=np.float64, count=total)
+        limites = np.fromiter((conta.limite_cheque_especial for conta in contas), dtype=np.float64, count=total)
+
+        encargos = self.calcular(saldos, limites)
+        data_formatada = (data or datetime.now()).strftime("%d-%m-%Y %H:%M:%S")
+
+        lancamentos = 0
+        for regra, valores in zip(self.regras, encargos):
+            indices = np.flatnonzero(valores)
+            for indice, valor in zip(indices.tolist(), valores[indices].tolist()):
+                regra.tipo(valor, data_formatada).registrar(contas[indice])
+            lancamentos += len(indices)
+
+        return lancamentos
@@ -0,0 +1,262 @@
+"""
+Fluxo de eventos (change data capture) do domínio do banco.
+
+O FluxoEventos guarda os eventos em um buffer circular limitado e cada
+assinante lê a partir do seu próprio offset, em lotes (``lotes`` e
+``lotes_async``) ou evento a evento (``for`` e ``async for``). Assim os consumidores processam apenas
+o que mudou, sem reler históricos inteiros.
+"""
+
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Iterator, List, Optional, Set, Tuple
+
+from .dominio import Ouvinte, adicionar_ouvinte, remover_ouvinte
+
+DESCARTAR = "descartar"
+BLOQUEAR = "bloquear"
+
+
+class Evento:
+    """Evento publicado no fluxo."""
+
+    __slots__ = ("offset", "tipo", "dados", "instante")
+
+    def __init__(self, offset: int, tipo: str, dados: dict, instante: float):
+        self.offset = offset
+        self.tipo = tipo
+        self.dados = dados
+        self.instante = instante
+
+    def __repr__(self) -> str:
+        return f"Evento(offset={self.offset}, tipo='{self.tipo}', dados={self.dados})"
+
+
+class FluxoEventos(Ouvinte):
+    """
+    Buffer circular de eventos com assinantes independentes.
+
+    Quando o buffer enche, a política DESCARTAR sobrescreve os eventos mais
+    antigos (assinantes atrasados pulam para o evento mais antigo disponível
+    e o salto é somado em ``perdidos``); a política BLOQUEAR faz o publicador
+    esperar até ``espera_maxima`` segundos pelo assinante mais lento. Com
+    BLOQUEAR, os assinantes devem rodar em outra thread que não a que publica.
+
+    A publicação nunca falha: ela acontece depois de a transação já ter
+    alterado a conta. Se a espera do BLOQUEAR se esgota, o evento é gravado
+    sobre o mais antigo e contado em ``estouros``. Para segurar o produtor
+    antes de qualquer alteração, chame ``aguardar_espaco`` antes de operar.
+    """
+
+    def __init__(self, capacidade: int = 65_536, politica: str = DESCARTAR, espera_maxima: float = 5.0):
+        if politica not in (DESCARTAR, BLOQUEAR):
+            raise ValueError(f"Política desconhecida: {politica}")
+
+        self._capacidade = capacidade
+        self._politica = politica
+        self._espera_maxima = espera_maxima
+        self._buffer: List[Optional[Evento]] = [None] * capacidade
+        self._proximo = 0
+        self.estouros = 0
+        self._condicao = threading.Condition()
+        self._assinaturas: Set['Assinatura'] = set()
+        self._esperas_async: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def __enter__(self) -> 'FluxoEventos':
+        return self.ativar()
+
+    def __exit__(self, *exc) -> None:
+        self.desativar()
+
+    @property
+    def inicio(self) -> int:
+        """Retorna o offset do evento mais antigo ainda disponível."""
+        return max(0, self._proximo - self._capacidade)
+
+    @property
+    def fim(self) -> int:
+        """Retorna o offset que o próximo evento publicado vai receber."""
+        return self._proximo
+
+    def ativar(self) -> 'FluxoEventos':
+        """Passa a receber os eventos do domínio."""
+        adicionar_ouvinte(self)
+        return self
+
+    def desativar(self) -> None:
+        """Deixa de receber os eventos do domínio."""
+        remover_ouvinte(self)
+
+    def aguardar_espaco(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera até o assinante mais lento deixar espaço para um novo evento.
+
+        Serve para aplicar a contrapressão no produtor antes de ele alterar
+        qualquer conta, em vez de dentro da notificação.
+
+        Args:
+            timeout: Segundos de espera; None usa ``espera_maxima``
+
+        Returns:
+            True se há espaço no buffer, False se o tempo acabou
+        """
+        with self._condicao:
+            return self._condicao.wait_for(self._tem_espaco, self._espera_maxima if timeout is None else timeout)
+
+    def publicar(self, tipo: str, dados: dict) -> int:
+        """
+        Adiciona um evento ao fluxo; nunca lança exceção para o domínio.
+
+        Args:
+            tipo: Tipo do evento ("transacao", "conta_criada", "cliente_criado"...)
+            dados: Conteúdo do evento
+
+        Returns:
+            Offset do evento publicado
+        """
+        with self._condicao:
+            if self._politica == BLOQUEAR and not self._condicao.wait_for(self._tem_espaco, self._espera_maxima):
+                self.estouros += 1
+
+            evento = Evento(self._proximo, tipo, dados, time.time())
+            self._buffer[self._proximo % self._capacidade] = evento
+            self._proximo += 1
+            self._condicao.notify_all()
+            esperas, self._esperas_async = self._esperas_async, []
+
+        self._acordar(esperas)
+        return evento.offset
+
+    def assinar(self, desde: Optional[int] = None) -> 'Assinatura':
+        """
+        Cria uma assinatura.
+
+        Args:
+            desde: Offset inicial, entre 0 e ``fim``; se omitido, recebe apenas eventos futuros
+
+        Returns:
+            Assinatura posicionada no offset pedido
+
+        Raises:
+            ValueError: Se o offset é negativo ou ainda não foi publicado
+        """
+        with self._condicao:
+            if desde is not None and not 0 <= desde <= self._proximo:
+                raise ValueError(f"Offset fora do fluxo: {desde} (fim em {self._proximo})")
+            assinatura = Assinatura(self, self._proximo if desde is None else desde)
+            self._assinaturas.add(assinatura)
+            return assinatura
+
+    def _tem_espaco(self) -> bool:
+        return self._proximo - self._menor_offset() < self._capacidade
+
+    def _menor_offset(self) -> int:
+        return min((assinatura.offset for assinatura in self._assinaturas), default=self._proximo)
+
+    def _cancelar(self, assinatura: 'Assinatura') -> None:
+        with self._condicao:
+            self._assinaturas.discard(assinatura)
+            assinatura.cancelada = True
+            self._condicao.notify_all()
+            esperas, self._esperas_async = self._esperas_async, []
+        self._acordar(esperas)
+
+    def _coletar(self, assinatura: 'Assinatura', maximo: int) -> List[Evento]:
+        # Chamado com a condição adquirida
+        inicio = max(assinatura.offset, self.inicio)
+        assinatura.perdidos += inicio - assinatura.offset
+        fim = min(self._proximo, inicio + maximo)
+
+        eventos = [self._buffer[offset % self._capacidade] for offset in range(inicio, fim)]
+        assinatura.offset = fim
+        if eventos and self._politica == BLOQUEAR:
+            self._condicao.notify_all()
+        return eventos
+
+    def _ler(self, assinatura: 'Assinatura', maximo: int, timeout: Optional[float]) -> List[Evento]:
+        with self._condicao:
+            if timeout != 0:
+                self._condicao.wait_for(
+                    lambda: self._proximo > assinatura.offset or assinatura.cancelada, timeout
+                )
+            return self._coletar(assinatura, maximo)
+
+    async def _ler_async(self, assinatura: 'Assinatura', maximo: int) -> List[Evento]:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condicao:
+                eventos = self._coletar(assinatura, maximo)
+                if eventos or assinatura.cancelada:
+                    return eventos
+                futuro = loop.create_future()
+                self._esperas_async.append((loop, futuro))
+            await futuro
+
+    @staticmethod
+    def _acordar(esperas: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]) -> None:
+        for loop, futuro in esperas:
+            loop.call_soon_threadsafe(_resolver, futuro)
+
+
+def _resolver(futuro: asyncio.Future) -> None:
+    if not futuro.done():
+        futuro.set_result(None)
+
+
+class Assinatura:
+    """Posição de um consumidor no fluxo de eventos."""
+
+    def __init__(self, fluxo: FluxoEventos, offset: int):
+        self._fluxo = fluxo
+        self.offset = offset
+        self.perdidos = 0
+        self.cancelada = False
+
+    def ler(self, maximo: int = 1_000, timeout: Optional[float] = None) -> List[Evento]:
+        """
+        Lê o próximo lote de eventos.
+
+        Args:
+            maximo: Tamanho máximo do lote
+            timeout: Segundos de espera por eventos; 0 não espera, None espera indefinidamente
+
+        Returns:
+            Lote de eventos (vazio se o tempo acabou ou a assinatura foi cancelada)
+        """
+        return self._fluxo._ler(self, maximo, timeout)
+
+    async def ler_async(self, maximo: int = 1_000) -> List[Evento]:
+        """Versão assíncrona de ler: aguarda sem bloquear o loop do asyncio."""
+        return await self._fluxo._ler_async(self, maximo)
+
+    def lotes(self, maximo: int = 1_000, timeout: Optional[float] = None) -> Iterator[List[Evento]]:
+        """Gera lotes de eventos até a assinatura ser cancelada ou o tempo de espera acabar."""
+        while not self.cancelada:
+            lote = self.ler(maximo, timeout)
+            if not lote:
+                return
+            yield lote
+
+    async def lotes_async(self, maximo: int = 1_000) -> AsyncIterator[List[Evento]]:
+        """Versão assíncrona de lotes: gera lotes até a assinatura ser cancelada."""
+        while not self.cancelada:
+            lote = await self.ler_async(maximo)
+            if not lote:
+                return
+            yield lote
+
+    def cancelar(self) -> None:
+        """Encerra a assinatura e acorda consumidores à espera."""
+        self._fluxo._cancelar(self)
+
+    def __iter__(self) -> Iterator[Evento]:
+        """Percorre os eventos já disponíveis, sem esperar por novos."""
+        for lote in self.lotes(timeout=0):
+            yield from lote
+
+    async def __aiter__(self) -> AsyncIterator[Evento]:
+        """Percorre os eventos um a um, aguardando novos até a assinatura ser cancelada."""
+        async for lote in self.lotes_async():
+            for evento in lote:
+                yield evento
@@ -0,0 +1,231 @@
+"""
+Listagem paginada de contas sobre índices ordenados.
+
+O IndiceContas mantém as contas ordenadas por número, nome do titular e
+saldo. Cada página é obtida a partir de um cursor (a chave do último item
+da página anterior) por busca binária, então o custo de uma página não
+depende do tamanho da carteira. O índice de saldo acompanha as transações
+por ser um ouvinte dos eventos do domínio.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .dominio import Conta, Ouvinte, adicionar_ouvinte, remover_ouvinte
+
+Chave = Tuple
+
+ORDENACOES = ("numero", "nome", "saldo")
+
+
+class ListaOrdenada:
+    """Lista ordenada em blocos: inserção e remoção em O(√n), busca em O(log n)."""
+
+    CARGA = 1_000
+
+    def __init__(self):
+        self._blocos: List[list] = []
+        self._maximos: list = []
+        self._tamanho = 0
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def adicionar(self, item) -> None:
+        """Insere um item mantendo a ordenação."""
+        self._tamanho += 1
+        if not self._blocos:
+            self._blocos.append([item])
+            self._maximos.append(item)
+            return
+
+        indice = min(bisect_left(self._maximos, item), len(self._blocos) - 1)
+        bloco = self._blocos[indice]
+        insort(bloco, item)
+        self._maximos[indice] = bloco[-1]
+
+        if len(bloco) > 2 * self.CARGA:
+            self._blocos[indice:indice + 1] = [bloco[:self.CARGA], bloco[self.CARGA:]]
+            self._maximos[indice:indice + 1] = [bloco[self.CARGA - 1], bloco[-1]]
+
+    def remover(self, item) -> None:
+        """Remove um item existente."""
+        indice = bisect_left(self._maximos, item)
+        bloco = self._blocos[indice]
+        del bloco[bisect_left(bloco, item)]
+        self._tamanho -= 1
+
+        if bloco:
+            self._maximos[indice] = bloco[-1]
+        else:
+            del self._blocos[indice]
+            del self._maximos[indice]
+
+    def a_partir_de(self, item=None, decrescente: bool = False) -> Iterator:
+        """
+        Percorre os itens estritamente depois de ``item`` na ordem pedida.
+
+        Args:
+            item: Ponto de partida (exclusivo); None começa do início ou do fim
+            decrescente: Percorre do maior para o menor
+        """
+        if not decrescente:
+            indice = 0 if item is None else bisect_right(self._maximos, item)
+            for posicao in range(indice, len(self._blocos)):
+                bloco = self._blocos[posicao]
+                inicio = bisect_right(bloco, item) if item is not None and posicao == indice else 0
+                yield from bloco[inicio:]
+            return
+
+        indice = len(self._blocos) - 1 if item is None else min(bisect_left(self._maximos, item), len(self._blocos) - 1)
+        for posicao in range(indice, -1, -1):
+            bloco = self._blocos[posicao]
+            fim = bisect_left(bloco, item) if item is not None and posicao == indice else len(bloco)
+            yield from reversed(bloco[:fim])
+
+
+class Pagina:
+    """Uma página da listagem e o cursor para buscar a seguinte."""
+
+    def __init__(self, contas: List[Conta], proximo_cursor: Optional[Chave]):
+        self.contas = contas
+        self.proximo_cursor = proximo_cursor
+
+    def __iter__(self) -> Iterator[Conta]:
+        return iter(self.contas)
+
+    def __len__(self) -> int:
+        return len(self.contas)
+
+
+class IndiceContas(Ouvinte):
+    """Índices ordenados das contas para listagens paginadas."""
+
+    def __init__(self):
+        self._contas: Dict[int, Conta] = {}
+        self._saldos: Dict[int, float] = {}
+        self._indices: Dict[str, ListaOrdenada] = {ordenacao: ListaOrdenada() for ordenacao in ORDENACOES}
+
+    def __len__(self) -> int:
+        return len(self._contas)
+
+    def __bool__(self) -> bool:
+        return bool(self._contas)
+
+    def ativar(self) -> 'IndiceContas':
+        """Passa a acompanhar as transações para manter o índice de saldo."""
+        adicionar_ouvinte(self)
+        return self
+
+    def desativar(self) -> None:
+        """Deixa de acompanhar as transações."""
+        remover_ouvinte(self)
+
+    def adicionar(self, conta: Conta) -> None:
+        """Adiciona uma conta aos índices."""
+        self._contas[conta.numero] = conta
+        self._saldos[conta.numero] = conta.saldo
+        self._indices["numero"].adicionar((conta.numero,))
+        self._indices["nome"].adicionar((self._nome(conta), conta.numero))
+        self._indices["saldo"].adicionar((conta.saldo, conta.numero))
+
+    def atualizar_saldo(self, numero: int) -> None:
+        """Reposiciona a conta no índice de saldo após uma movimentação."""
+        conta = self._contas.get(numero)
+        if conta is None or self._saldos[numero] == conta.saldo:
+            return
+
+        self._indices["saldo"].remover((self._saldos[numero], numero))
+        self._indices["saldo"].adicionar((conta.saldo, numero))
+        self._saldos[numero] = conta.saldo
+
+    def publicar(self, tipo: str, dados: dict) -> None:
+        if tipo == "transacao":
+            self.atualizar_saldo(dados["conta"])
+
+    def listar(
+        self,
+        ordenar_por: str = "numero",
+        cursor: Optional[Chave] = None,
+        limite: int = 20,
+        decrescente: bool = False,
+        saldo_minimo: Optional[float] = None,
+        saldo_maximo: Optional[float] = None,
+        agencia: Optional[str] = None,
+    ) -> Pagina:
+        """
+        Retorna uma página de contas.
+
+        Args:
+            ordenar_por: "numero", "nome" (do titular) ou "saldo"
+            cursor: ``proximo_cursor`` da página anterior; None para a primeira
+            limite: Quantidade máxima de contas na página
+            decrescente: Ordena do maior para o menor
+            saldo_minimo: Filtra contas com saldo a partir deste valor
+            saldo_maximo: Filtra contas com saldo até este valor
+            agencia: Filtra contas desta agência
+
+        Returns:
+            Página com as contas e o cursor da próxima (None se acabou)
+        """
+        if ordenar_por not in ORDENACOES:
+            raise ValueError(f"Ordenação desconhecida: {ordenar_por}")
+
+        passa_no_filtro = self._filtro(saldo_minimo, saldo_maximo, agencia)
+        fora_do_intervalo = self._fim_do_intervalo(ordenar_por, decrescente, saldo_minimo, saldo_maximo)
+        if cursor is None and ordenar_por == "saldo":
+            cursor = self._inicio_do_intervalo(decrescente, saldo_minimo, saldo_maximo)
+
+        contas: List[Conta] = []
+        ultima_chave = None
+        for chave in self._indices[ordenar_por].a_partir_de(cursor, decrescente):
+            if fora_do_intervalo(chave):
+                return Pagina(contas, None)
+
+            conta = self._contas[chave[-1]]
+            if passa_no_filtro(conta):
+                if len(contas) == limite:
+                    return Pagina(contas, ultima_chave)
+                contas.append(conta)
+                ultima_chave = chave
+
+        return Pagina(contas, None)
+
+    @staticmethod
+    def _nome(conta: Conta) -> str:
+        return getattr(conta.cliente, "nome", "").casefold()
+
+    @staticmethod
+    def _filtro(
+        saldo_minimo: Optional[float], saldo_maximo: Optional[float], agencia: Optional[str]
+    ) -> Callable[[Conta], bool]:
+        def passa_no_filtro(conta: Conta) -> bool:
+            return (
+                (saldo_minimo is None or conta.saldo >= saldo_minimo)
+                and (saldo_maximo is None or conta.saldo <= saldo_maximo)
+                and (agencia is None or conta.agencia == agencia)
+            )
+
+        return passa_no_filtro
+
+    @staticmethod
+    def _inicio_do_intervalo(
+        decrescente: bool, saldo_minimo: Optional[float], saldo_maximo: Optional[float]
+    ) -> Optional[Chave]:
+        # Chaves que ficam logo antes do intervalo de saldo pedido
+        if not decrescente and saldo_minimo is not None:
+            return (saldo_minimo, float("-inf"))
+        if decrescente and saldo_maximo is not None:
+            return (saldo_maximo, float("inf"))
+        return None
+
+    @staticmethod
+    def _fim_do_intervalo(
+        ordenar_por: str, decrescente: bool, saldo_minimo: Optional[float], saldo_maximo: Optional[float]
+    ) -> Callable[[Chave], bool]:
+        # Ordenando por saldo, a listagem para assim que sai do intervalo
+        if ordenar_por == "saldo" and not decrescente and saldo_maximo is not None:
+            return lambda chave: chave[0] > saldo_maximo
+        if ordenar_por == "saldo" and decrescente and saldo_minimo is not None:
+            return lambda chave: chave[0] < saldo_minimo
+        return lambda chave: False
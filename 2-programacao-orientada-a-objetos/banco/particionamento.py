@@ -0,0 +1,311 @@
+"""Banco em memória particionado, com um worker por partição."""
+
+import itertools
+import multiprocessing
+import queue
+import threading
+import zlib
+from concurrent.futures import Future
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .dominio import (
+    Conta,
+    ContaCorrente,
+    Deposito,
+    EstornoTransferencia,
+    PessoaFisica,
+    Saque,
+    Transacao,
+    TransferenciaEnviada,
+    TransferenciaRecebida,
+)
+from .validacao import normalizar_cpf, validar_registro
+
+
+class Particao:
+    """
+    Partição do banco, dona exclusiva de um subconjunto de clientes e contas.
+
+    Clientes pertencem à partição do hash do CPF. As contas são numeradas de
+    forma que ``(numero - 1) % total`` aponte para a partição do titular, o que
+    mantém cliente e contas juntos e permite rotear operações só pelo número.
+    """
+
+    def __init__(self, indice: int, total: int):
+        self.indice = indice
+        self.total = total
+        self.clientes: Dict[str, PessoaFisica] = {}
+        self.contas: Dict[int, Conta] = {}
+        self._proximo_numero = indice + 1
+
+    def executar(self, operacao: str, args: tuple):
+        """Executa uma operação pelo nome; chamado apenas pelo worker da partição."""
+        return getattr(self, f"_op_{operacao}")(*args)
+
+    def _op_criar_cliente(self, nome: str, data_nascimento: date, cpf: str, endereco: str) -> bool:
+        if cpf in self.clientes:
+            return False
+
+        self.clientes[cpf] = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
+        return True
+
+    def _op_criar_conta(self, cpf: str) -> Optional[int]:
+        cliente = self.clientes.get(cpf)
+        if not cliente:
+            return None
+
+        numero = self._proximo_numero
+        self._proximo_numero += self.total
+
+        conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero)
+        self.contas[numero] = conta
+        cliente.adicionar_conta(conta)
+        return numero
+
+    def _registrar(self, numero: int, transacao: 'Transacao') -> bool:
+        conta = self.contas.get(numero)
+        if not conta:
+            return False
+
+        versao = conta.historico.versao
+        conta.cliente.realizar_transacao(conta, transacao)
+        return conta.historico.versao > versao
+
+    def _op_depositar(self, numero: int, valor: float) -> bool:
+        return self._registrar(numero, Deposito(valor))
+
+    def _op_sacar(self, numero: int, valor: float) -> bool:
+        return self._registrar(numero, Saque(valor))
+
+    def _op_debitar_transferencia(self, numero: int, valor: float) -> bool:
+        return self._registrar(numero, TransferenciaEnviada(valor))
+
+    def _op_creditar_transferencia(self, numero: int, valor: float) -> bool:
+        return self._registrar(numero, TransferenciaRecebida(valor))
+
+    def _op_estornar_transferencia(self, numero: int, valor: float) -> bool:
+        return self._registrar(numero, EstornoTransferencia(valor))
+
+    def _op_transferir(self, origem: int, destino: int, valor: float) -> bool:
+        if destino not in self.contas or not self._op_debitar_transferencia(origem, valor):
+            return False
+
+        try:
+            if self._op_creditar_transferencia(destino, valor):
+                return True
+        except Exception:
+            self._op_estornar_transferencia(origem, valor)
+            raise
+
+        self._op_estornar_transferencia(origem, valor)
+        return False
+
+    def _op_saldo(self, numero: int) -> Optional[float]:
+        conta = self.contas.get(numero)
+        return conta.saldo if conta else None
+
+    def _op_lote(self, operacoes: List[Tuple[str, tuple]]) -> list:
+        return [self.executar(operacao, args) for operacao, args in operacoes]
+
+
+def _laco_particao(particao: Particao, entrada, saida) -> None:
+    """Laço do worker: consome operações da fila da partição e publica os resultados."""
+    while True:
+        mensagem = entrada.get()
+        if mensagem is None:
+            break
+
+        identificador, operacao, args = mensagem
+        try:
+            saida.put((identificador, True, particao.executar(operacao, args)))
+        except Exception as erro:
+            saida.put((identificador, False, erro))
+
+
+class BancoParticionado:
+    """
+    Banco em memória dividido em N partições, cada uma com seu próprio worker.
+
+    As operações são roteadas para a partição dona do CPF ou da conta e
+    devolvem um ``Future``. Transferências entre partições diferentes são
+    coordenadas aqui: débito na origem, crédito no destino e estorno na origem
+    caso o crédito falhe. Os lançamentos de transferência não passam pelos
+    inspetores nem pelas regras de saque do cliente.
+    """
+
+    def __init__(self, numero_particoes: int = 4, usar_processos: bool = False):
+        if numero_particoes < 1:
+            raise ValueError("numero_particoes deve ser maior ou igual a 1")
+
+        self._total = numero_particoes
+        self._pendentes: Dict[int, Future] = {}
+        self._trava = threading.Lock()
+        self._contador = itertools.count()
+
+        if usar_processos:
+            contexto = multiprocessing.get_context()
+            self._saida = contexto.Queue()
+            criar_fila, criar_worker = contexto.Queue, contexto.Process
+        else:
+            self._saida = queue.SimpleQueue()
+            criar_fila, criar_worker = queue.SimpleQueue, threading.Thread
+
+        self._entradas = []
+        self._workers = []
+        for indice in range(numero_particoes):
+            entrada = criar_fila()
+            worker = criar_worker(
+                target=_laco_particao,
+                args=(Particao(indice, numero_particoes), entrada, self._saida),
+                daemon=True,
+            )
+            worker.start()
+            self._entradas.append(entrada)
+            self._workers.append(worker)
+
+        self._coletor = threading.Thread(target=self._coletar_resultados, daemon=True)
+        self._coletor.start()
+
+    def __enter__(self) -> 'BancoParticionado':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.encerrar()
+
+    @property
+    def numero_particoes(self) -> int:
+        """Retorna o número de partições."""
+        return self._total
+
+    def particao_do_cpf(self, cpf: str) -> int:
+        """Retorna o índice da partição dona de um CPF."""
+        return zlib.crc32(cpf.encode()) % self._total
+
+    def particao_da_conta(self, numero: int) -> int:
+        """Retorna o índice da partição dona de uma conta."""
+        return (numero - 1) % self._total
+
+    def criar_cliente(self, nome: str, data_nascimento: str, cpf: str, endereco: str) -> Future:
+        """
+        Valida o cadastro e cria o cliente na partição do CPF.
+
+        O resultado do Future indica se o cliente foi criado; dados inválidos
+        lançam ErroValidacao antes de qualquer roteamento.
+        """
+        registro = validar_registro(
+            {"nome": nome, "data_nascimento": data_nascimento, "cpf": cpf, "endereco": endereco}
+        )
+        return self.criar_cliente_validado(registro)
+
+    def criar_cliente_validado(self, registro: dict) -> Future:
+        """Cria um cliente a partir de um registro já produzido pelo estágio de validação."""
+        return self._submeter(
+            self.particao_do_cpf(registro["cpf"]),
+            "criar_cliente",
+            registro["nome"],
+            registro["data_nascimento"],
+            registro["cpf"],
+            registro["endereco"],
+        )
+
+    def criar_conta(self, cpf: str) -> Future:
+        """Cria uma conta para o cliente; o resultado é o número da conta ou None."""
+        cpf = normalizar_cpf(cpf)
+        return self._submeter(self.particao_do_cpf(cpf), "criar_conta", cpf)
+
+    def depositar(self, numero: int, valor: float) -> Future:
+        """Deposita em uma conta; o resultado indica se a transação foi registrada."""
+        return self._submeter(self.particao_da_conta(numero), "depositar", numero, valor)
+
+    def sacar(self, numero: int, valor: float) -> Future:
+        """Saca de uma conta; o resultado indica se a transação foi registrada."""
+        return self._submeter(self.particao_da_conta(numero), "sacar", numero, valor)
+
+    def saldo(self, numero: int) -> Future:
+        """Consulta o saldo de uma conta; o resultado é None se a conta não existir."""
+        return self._submeter(self.particao_da_conta(numero), "saldo", numero)
+
+    def depositar_em_lote(self, depositos: List[Tuple[int, float]]) -> List[Future]:
+        """
+        Agrupa depósitos por partição e envia uma única mensagem para cada uma.
+
+        Args:
+            depositos: Pares (número da conta, valor)
+
+        Returns:
+            Um Future por partição envolvida, com a lista de resultados daquela partição
+        """
+        lotes: Dict[int, List[Tuple[str, tuple]]] = {}
+        for numero, valor in depositos:
+            lotes.setdefault(self.particao_da_conta(numero), []).append(("depositar", (numero, valor)))
+
+        return [self._submeter(indice, "lote", operacoes) for indice, operacoes in lotes.items()]
+
+    def transferir(self, origem: int, destino: int, valor: float) -> bool:
+        """
+        Transfere um valor entre duas contas, possivelmente em partições diferentes.
+
+        Args:
+            origem: Número da conta de origem
+            destino: Número da conta de destino
+            valor: Valor a ser transferido
+
+        Returns:
+            True se a transferência foi concluída, False caso contrário
+        """
+        particao_origem = self.particao_da_conta(origem)
+        particao_destino = self.particao_da_conta(destino)
+
+        if particao_origem == particao_destino:
+            return self._submeter(particao_origem, "transferir", origem, destino, valor).result()
+
+        if self.saldo(destino).result() is None:
+            return False
+
+        if not self._submeter(particao_origem, "debitar_transferencia", origem, valor).result():
+            return False
+
+        try:
+            if self._submeter(particao_destino, "creditar_transferencia", destino, valor).result():
+                return True
+        except Exception:
+            self._submeter(particao_origem, "estornar_transferencia", origem, valor).result()
+            raise
+
+        self._submeter(particao_origem, "estornar_transferencia", origem, valor).result()
+        return False
+
+    def encerrar(self) -> None:
+        """Finaliza os workers após o processamento das operações já enfileiradas."""
+        for entrada in self._entradas:
+            entrada.put(None)
+        for worker in self._workers:
+            worker.join()
+
+        self._saida.put(None)
+        self._coletor.join()
+
+    def _submeter(self, indice: int, operacao: str, *args) -> Future:
+        futuro: Future = Future()
+        with self._trava:
+            identificador = next(self._contador)
+            self._pendentes[identificador] = futuro
+
+        self._entradas[indice].put((identificador, operacao, args))
+        return futuro
+
+    def _coletar_resultados(self) -> None:
+        while True:
+            mensagem = self._saida.get()
+            if mensagem is None:
+                break
+
+            identificador, sucesso, resultado = mensagem
+            with self._trava:
+                futuro = self._pendentes.pop(identificador)
+
+            if sucesso:
+                futuro.set_result(resultado)
+            else:
+                futuro.set_exception(resultado)
@@ -0,0 +1,269 @@
+"""Interface de menu em modo texto do sistema bancário."""
+
+import textwrap
+from typing import Dict, Optional
+
+from .armazenamento import CacheExtratos
+from .dominio import Conta, ContaCorrente, Deposito, PessoaFisica, Saque
+from .listagem import ORDENACOES, IndiceContas
+from .validacao import ErroValidacao, normalizar_cpf, validar_cpf, validar_registro
+
+
+def menu():
+    """Exibe o menu principal e retorna a opção escolhida."""
+    menu = """\n
+    ================ MENU ================
+    [d]\tDepositar
+    [s]\tSacar
+    [e]\tExtrato
+    [nc]\tNova conta
+    [lc]\tListar contas
+    [nu]\tNovo usuário
+    [q]\tSair
+    => """
+    return input(textwrap.dedent(menu))
+
+
+def filtrar_cliente(cpf: str, clientes: Dict[str, PessoaFisica]) -> Optional[PessoaFisica]:
+    """
+    Filtra e retorna um cliente pelo CPF.
+
+    Args:
+        cpf: CPF do cliente, com ou sem pontuação
+        clientes: Clientes indexados pelo CPF normalizado
+
+    Returns:
+        Cliente encontrado ou None
+    """
+    return clientes.get(normalizar_cpf(cpf))
+
+
+def recuperar_conta_cliente(cliente: PessoaFisica) -> Optional[Conta]:
+    """
+    Recupera a conta de um cliente.
+
+    Args:
+        cliente: Cliente
+
+    Returns:
+        Conta do cliente ou None
+    """
+    if not cliente.contas:
+        print("\n@@@ Cliente não possui conta! @@@")
+        return None
+
+    # FIXME: não permite cliente escolher a conta
+    return cliente.contas[0]
+
+
+def depositar(clientes: Dict[str, PessoaFisica]) -> None:
+    """
+    Realiza um depósito em uma conta.
+
+    Args:
+        clientes: Clientes indexados pelo CPF
+    """
+    cpf = input("Informe o CPF do cliente: ")
+    cliente = filtrar_cliente(cpf, clientes)
+
+    if not cliente:
+        print("\n@@@ Cliente não encontrado! @@@")
+        return
+
+    valor = float(input("Informe o valor do depósito: "))
+    transacao = Deposito(valor)
+
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return
+
+    cliente.realizar_transacao(conta, transacao)
+
+
+def sacar(clientes: Dict[str, PessoaFisica]) -> None:
+    """
+    Realiza um saque de uma conta.
+
+    Args:
+        clientes: Clientes indexados pelo CPF
+    """
+    cpf = input("Informe o CPF do cliente: ")
+    cliente = filtrar_cliente(cpf, clientes)
+
+    if not cliente:
+        print("\n@@@ Cliente não encontrado! @@@")
+        return
+
+    valor = float(input("Informe o valor do saque: "))
+    transacao = Saque(valor)
+
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return
+
+    cliente.realizar_transacao(conta, transacao)
+
+
+def exibir_extrato(clientes: Dict[str, PessoaFisica], cache: CacheExtratos) -> None:
+    """
+    Exibe o extrato de uma conta.
+
+    Args:
+        clientes: Clientes indexados pelo CPF
+        cache: Cache de extratos renderizados
+    """
+    cpf = input("Informe o CPF do cliente: ")
+    cliente = filtrar_cliente(cpf, clientes)
+
+    if not cliente:
+        print("\n@@@ Cliente não encontrado! @@@")
+        return
+
+    conta = recuperar_conta_cliente(cliente)
+    if not conta:
+        return
+
+    print("\n================ EXTRATO ================")
+    transacoes = cache.obter(conta)
+    print(transacoes)
+    print(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
+    print("==========================================")
+
+
+def criar_cliente(clientes: Dict[str, PessoaFisica]) -> None:
+    """
+    Cria um novo cliente (usuário).
+
+    Args:
+        clientes: Clientes indexados pelo CPF
+    """
+    cpf = input("Informe o CPF (somente números): ")
+
+    try:
+        cpf = validar_cpf(cpf)
+    except ErroValidacao as erro:
+        print(f"\n@@@ {erro} @@@")
+        return
+
+    if cpf in clientes:
+        print("\n@@@ Já existe cliente com esse CPF! @@@")
+        return
+
+    nome = input("Informe o nome completo: ")
+    data_nascimento = input("Informe a data de nascimento (dd-mm-aaaa): ")
+    endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ")
+
+    try:
+        registro = validar_registro(
+            {"nome": nome, "data_nascimento": data_nascimento, "cpf": cpf, "endereco": endereco}
+        )
+    except ErroValidacao as erro:
+        print(f"\n@@@ {erro} @@@")
+        return
+
+    clientes[cpf] = PessoaFisica(**registro)
+
+    print("\n=== Cliente criado com sucesso! ===")
+
+
+def criar_conta(numero_conta: int, clientes: Dict[str, PessoaFisica], contas: IndiceContas) -> int:
+    """
+    Cria uma nova conta para um cliente.
+
+    Args:
+        numero_conta: Número da próxima conta
+        clientes: Clientes indexados pelo CPF
+        contas: Índice das contas cadastradas
+
+    Returns:
+        Novo número de conta
+    """
+    cpf = input("Informe o CPF do cliente: ")
+    cliente = filtrar_cliente(cpf, clientes)
+
+    if not cliente:
+        print("\n@@@ Cliente não encontrado, fluxo de criação de conta encerrado! @@@")
+        return numero_conta
+
+    conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
+    contas.adicionar(conta)
+    cliente.contas.append(conta)
+
+    print("\n=== Conta criada com sucesso! ===")
+    return numero_conta + 1
+
+
+def listar_contas(contas: IndiceContas, tamanho_pagina: int = 20) -> None:
+    """
+    Lista as contas cadastradas, uma página por vez.
+
+    Args:
+        contas: Índice das contas cadastradas
+        tamanho_pagina: Quantidade de contas por página
+    """
+    if not contas:
+        print("\n@@@ Nenhuma conta cadastrada! @@@")
+        return
+
+    ordenar_por = input("Ordenar por [numero/nome/saldo] (Enter para número): ").strip().lower() or "numero"
+    if ordenar_por not in ORDENACOES:
+        print("\n@@@ Ordenação inválida! @@@")
+        return
+
+    saldo_minimo = input("Saldo mínimo (Enter para todas): ").strip()
+    try:
+        saldo_minimo = float(saldo_minimo) if saldo_minimo else None
+    except ValueError:
+        print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+        return
+
+    print("\n================ LISTA DE CONTAS ================")
+    cursor = None
+    while True:
+        pagina = contas.listar(ordenar_por, cursor, tamanho_pagina, saldo_minimo=saldo_minimo)
+        linhas = []
+        for conta in pagina:
+            linhas.append("=" * 50)
+            linhas.append(textwrap.dedent(str(conta)))
+        print("\n".join(linhas))
+
+        cursor = pagina.proximo_cursor
+        if cursor is None or input("[Enter] próxima página, [q] voltar: ").strip().lower() == "q":
+            break
+
+
+def main():
+    """Função principal que executa o loop do menu."""
+    clientes: Dict[str, PessoaFisica] = {}
+    contas = IndiceContas().ativar()
+    numero_conta = 1
+    cache_extratos = CacheExtratos()
+
+    while True:
+        opcao = menu()
+
+        if opcao == "d":
+            depositar(clientes)
+
+        elif opcao == "s":
+            sacar(clientes)
+
+        elif opcao == "e":
+            exibir_extrato(clientes, cache_extratos)
+
+        elif opcao == "nu":
+            criar_cliente(clientes)
+
+        elif opcao == "nc":
+            numero_conta = criar_conta(numero_conta, clientes, contas)
+
+        elif opcao == "lc":
+            listar_contas(contas)
+
+        elif opcao == "q":
+            print("\n=== Obrigado por usar nosso sistema! ===")
+            contas.desativar()
+            break
+
+        else:
+            print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
@@ -0,0 +1,281 @@
+"""Validação e normalização dos dados de cadastro de clientes."""
+
+import itertools
+import re
+from datetime import date
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# Só dígitos ASCII: \d aceitaria dígitos Unicode (ex.: "１２３"), criando CPFs duplicados
+_PADRAO_NAO_DIGITOS = re.compile(r"[^0-9]+")
+_PADRAO_CPF = re.compile(r"[0-9]{11}")
+_PADRAO_DATA = re.compile(r"\s*([0-9]{2})-([0-9]{2})-([0-9]{4})\s*")
+_PADRAO_ESPACOS = re.compile(r"\s+")
+_PADRAO_SEPARADOR_VIRGULA = re.compile(r"\s*,\s*")
+_PADRAO_SEPARADOR_HIFEN = re.compile(r"\s+-\s*|\s*-\s+")
+_PADRAO_SEPARADOR_BARRA = re.compile(r"\s*/\s*")
+_PADRAO_UF = re.compile(r"/([A-Za-z]{2})$")
+_PESOS_CPF_1 = tuple(range(10, 1, -1))
+_PESOS_CPF_2 = tuple(range(11, 1, -1))
+
+
+class ErroValidacao(ValueError):
+    """Erro lançado quando um campo de cadastro é inválido."""
+
+    def __init__(self, campo: str, mensagem: str):
+        super().__init__(mensagem)
+        self.campo = campo
+
+
+def normalizar_cpf(cpf: str) -> str:
+    """Remove pontuação e espaços do CPF, mantendo apenas os dígitos."""
+    return _PADRAO_NAO_DIGITOS.sub("", cpf)
+
+
+def _digito_verificador(digitos: str, pesos: Tuple[int, ...]) -> int:
+    resto = sum(int(digito) * peso for digito, peso in zip(digitos, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def gerar_cpf(base: int) -> str:
+    """
+    Gera um CPF válido a partir de um número base de até nove dígitos.
+
+    Args:
+        base: Número de 0 a 999999999 que forma os nove primeiros dígitos
+
+    Returns:
+        CPF com os dígitos verificadores, somente números
+
+    Raises:
+        ValueError: Se a base está fora do intervalo ou tem todos os dígitos
+            iguais (como 0 ou 111111111), pois validar_cpf recusa esses CPFs
+    """
+    if not 0 <= base <= 999_999_999:
+        raise ValueError(f"Base do CPF fora do intervalo: {base}")
+
+    digitos = f"{base:09d}"
+    if digitos == digitos[0] * 9:
+        raise ValueError(f"Base do CPF com dígitos repetidos: {digitos}")
+    digitos += str(_digito_verificador(digitos, _PESOS_CPF_1))
+    return digitos + str(_digito_verificador(digitos, _PESOS_CPF_2))
+
+
+def validar_cpf(cpf: str) -> str:
+    """
+    Valida os dígitos verificadores de um CPF.
+
+    Args:
+        cpf: CPF com ou sem pontuação
+
+    Returns:
+        CPF normalizado (somente números)
+
+    Raises:
+        ErroValidacao: Se o CPF for inválido
+    """
+    digitos = normalizar_cpf(cpf)
+
+    if not _PADRAO_CPF.fullmatch(digitos) or digitos == digitos[0] * 11:
+        raise ErroValidacao("cpf", "CPF inválido!")
+
+    if (
+        _digito_verificador(digitos[:9], _PESOS_CPF_1) != int(digitos[9])
+        or _digito_verificador(digitos[:10], _PESOS_CPF_2) != int(digitos[10])
+    ):
+        raise ErroValidacao("cpf", "CPF inválido!")
+
+    return digitos
+
+
+def converter_data(texto: str) -> date:
+    """
+    Converte uma data no formato dd-mm-aaaa.
+
+    Args:
+        texto: Data informada pelo usuário
+
+    Returns:
+        Data convertida
+
+    Raises:
+        ErroValidacao: Se a data for inválida ou estiver no futuro
+    """
+    correspondencia = _PADRAO_DATA.fullmatch(texto)
+    if not correspondencia:
+        raise ErroValidacao("data_nascimento", "Data de nascimento deve estar no formato dd-mm-aaaa!")
+
+    dia, mes, ano = (int(parte) for parte in correspondencia.groups())
+    try:
+        data = date(ano, mes, dia)
+    except ValueError:
+        raise ErroValidacao("data_nascimento", "Data de nascimento inválida!") from None
+
+    if data > date.today():
+        raise ErroValidacao("data_nascimento", "Data de nascimento no futuro!")
+
+    return data
+
+
+def normalizar_endereco(endereco: str) -> str:
+    """
+    Normaliza espaços e separadores do endereço.
+
+    O formato esperado é "logradouro, nro - bairro - cidade/sigla estado";
+    a sigla do estado é convertida para maiúsculas.
+
+    Raises:
+        ErroValidacao: Se o endereço estiver vazio
+    """
+    endereco = _PADRAO_ESPACOS.sub(" ", endereco).strip()
+    if not endereco:
+        raise ErroValidacao("endereco", "Endereço não informado!")
+
+    endereco = _PADRAO_SEPARADOR_VIRGULA.sub(", ", endereco)
+    endereco = _PADRAO_SEPARADOR_HIFEN.sub(" - ", endereco)
+    endereco = _PADRAO_SEPARADOR_BARRA.sub("/", endereco)
+    return _PADRAO_UF.sub(lambda uf: "/" + uf.group(1).upper(), endereco)
+
+
+def validar_registro(registro: dict) -> dict:
+    """
+    Valida e normaliza um registro de cliente.
+
+    Args:
+        registro: Dicionário com nome, data_nascimento, cpf e endereco
+
+    Returns:
+        Novo dicionário com CPF normalizado, data convertida e endereço normalizado
+
+    Raises:
+        ErroValidacao: No primeiro campo inválido encontrado
+    """
+    nome = _PADRAO_ESPACOS.sub(" ", registro["nome"]).strip()
+    if not nome:
+        raise ErroValidacao("nome", "Nome não informado!")
+
+    return {
+        "nome": nome,
+        "data_nascimento": converter_data(registro["data_nascimento"]),
+        "cpf": validar_cpf(registro["cpf"]),
+        "endereco": normalizar_endereco(registro["endereco"]),
+    }
+
+
+def validar_registros(
+    registros: Iterable[dict], erros: Optional[List[Tuple[int, dict, ErroValidacao]]] = None
+) -> Iterator[dict]:
+    """
+    Estágio de validação em streaming: produz apenas os registros válidos.
+
+    Args:
+        registros: Registros de clientes, consumidos um a um
+        erros: Lista opcional que recebe (índice, registro, erro) dos rejeitados
+
+    Yields:
+        Registros validados e normalizados
+    """
+    for indice, registro in enumerate(registros):
+        try:
+            yield validar_registro(registro)
+        except ErroValidacao as erro:
+            if erros is not None:
+                erros.append((indice, registro, erro))
+
+
+def validar_cpfs_em_lote(cpfs: List[str]) -> List[bool]:
+    """
+    Valida os dígitos verificadores de vários CPFs já normalizados.
+
+    Usa NumPy quando disponível para calcular os dígitos de todo o lote de
+    uma vez; caso contrário, valida CPF por CPF.
+
+    Args:
+        cpfs: CPFs contendo somente números
+
+    Returns:
+        Lista indicando, para cada CPF, se ele é válido
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    bem_formados = [bool(_PADRAO_CPF.fullmatch(cpf)) for cpf in cpfs]
+
+    if np is None or not any(bem_formados):
+        resultado = []
+        for cpf, bem_formado in zip(cpfs, bem_formados):
+            try:
+                resultado.append(bem_formado and bool(validar_cpf(cpf)))
+            except ErroValidacao:
+                resultado.append(False)
+        return resultado
+
+    mascara = np.array(bem_formados)
+    texto = "".join(cpf for cpf, bem_formado in zip(cpfs, bem_formados) if bem_formado)
+    digitos = (np.frombuffer(texto.encode("ascii"), dtype=np.uint8) - ord("0")).reshape(-1, 11).astype(np.int32)
+
+    resto_1 = digitos[:, :9] @ np.array(_PESOS_CPF_1) % 11
+    resto_2 = digitos[:, :10] @ np.array(_PESOS_CPF_2) % 11
+    dv_1 = np.where(resto_1 < 2, 0, 11 - resto_1)
+    dv_2 = np.where(resto_2 < 2, 0, 11 - resto_2)
+    repetidos = (digitos == digitos[:, :1]).all(axis=1)
+
+    validos = (dv_1 == digitos[:, 9]) & (dv_2 == digitos[:, 10]) & ~repetidos
+    mascara[mascara] = validos
+    return mascara.tolist()
+
+
+def validar_registros_em_lote(
+    registros: Iterable[dict],
+    tamanho_bloco: int = 100_000,
+    erros: Optional[List[Tuple[int, dict, ErroValidacao]]] = None,
+) -> Iterator[dict]:
+    """
+    Versão em blocos de validar_registros para importações grandes.
+
+    Os CPFs de cada bloco são validados de uma vez (vetorizado quando o NumPy
+    está disponível); datas e endereços usam os padrões pré-compilados.
+
+    Args:
+        registros: Registros de clientes, consumidos em blocos
+        tamanho_bloco: Quantidade de registros por bloco
+        erros: Lista opcional que recebe (índice, registro, erro) dos rejeitados
+
+    Yields:
+        Registros validados e normalizados, na ordem de entrada
+    """
+    iterador = iter(registros)
+    deslocamento = 0
+
+    while True:
+        bloco = list(itertools.islice(iterador, tamanho_bloco))
+        if not bloco:
+            break
+
+        cpfs = [normalizar_cpf(registro["cpf"]) for registro in bloco]
+        cpfs_validos = validar_cpfs_em_lote(cpfs)
+
+        for indice, (registro, cpf, cpf_valido) in enumerate(zip(bloco, cpfs, cpfs_validos), deslocamento):
+            try:
+                # Mesma ordem de campos de validar_registro, para o erro apontar o mesmo campo
+                nome = _PADRAO_ESPACOS.sub(" ", registro["nome"]).strip()
+                if not nome:
+                    raise ErroValidacao("nome", "Nome não informado!")
+
+                data_nascimento = converter_data(registro["data_nascimento"])
+                if not cpf_valido:
+                    raise ErroValidacao("cpf", "CPF inválido!")
+
+                yield {
+                    "nome": nome,
+                    "data_nascimento": data_nascimento,
+                    "cpf": cpf,
+                    "endereco": normalizar_endereco(registro["endereco"]),
+                }
+            except ErroValidacao as erro:
+                if erros is not None:
+                    erros.append((indice, registro, erro))
+
+        deslocamento += len(bloco)
@@ -1,6 +1,233 @@
 #Adicione três notas e calcule a média delas
-nota1 = float(input("Digite a primeira nota: "))    
-nota2 = float(input("Digite a segunda nota: "))    
-nota3 = float(input("Digite a terceira nota: "))
-media = (nota1 + nota2 + nota3) / 3
-print("A média das notas é:", media)
\ No newline at end of file
+#Modo arquivo: python media_de_notas.py NOTAS.csv [...] [--por aluno|turma] [--processos N] [--numpy]
+#O CSV deve ter cabeçalho com as colunas "aluno", "turma" e "nota"
+import argparse
+import csv
+import itertools
+import math
+import random
+import sys
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERCENTIS_PADRAO = (50, 90)
+
+
+class SketchQuantis:
+    # Sketch de quantis com compactação por níveis (estilo KLL): memória limitada
+    # a cerca de k valores por nível e log(n / k) níveis, e pode ser mesclado
+
+    __slots__ = ("k", "niveis")
+
+    def __init__(self, k=128):
+        self.k = k
+        self.niveis = [[]]
+
+    def adicionar(self, valor):
+        self.niveis[0].append(valor)
+        if len(self.niveis[0]) >= self.k:
+            self._compactar()
+
+    def mesclar(self, outro):
+        for nivel, valores in enumerate(outro.niveis):
+            if nivel == len(self.niveis):
+                self.niveis.append([])
+            self.niveis[nivel].extend(valores)
+        self._compactar()
+
+    def _compactar(self):
+        # Cada nível cheio é ordenado e metade dos valores sobe com o dobro do peso
+        for nivel, valores in enumerate(self.niveis):
+            if len(valores) < self.k:
+                continue
+            valores.sort()
+            sobra = valores.pop() if len(valores) % 2 else None
+            if nivel + 1 == len(self.niveis):
+                self.niveis.append([])
+            self.niveis[nivel + 1].extend(valores[random.randint(0, 1)::2])
+            valores.clear()
+            if sobra is not None:
+                valores.append(sobra)
+
+    def quantil(self, q):
+        itens = sorted((valor, 1 << nivel) for nivel, valores in enumerate(self.niveis) for valor in valores)
+        if not itens:
+            return math.nan
+        alvo = q * sum(peso for _, peso in itens)
+        acumulado = 0
+        for valor, peso in itens:
+            acumulado += peso
+            if acumulado >= alvo:
+                return valor
+        return itens[-1][0]
+
+
+class Estatisticas:
+    # Média e variância em uma passada (Welford), mínimo, máximo e quantis aproximados
+
+    __slots__ = ("n", "media", "m2", "minimo", "maximo", "sketch")
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.sketch = SketchQuantis()
+
+    def adicionar(self, nota):
+        self.n += 1
+        delta = nota - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (nota - self.media)
+        self.minimo = min(self.minimo, nota)
+        self.maximo = max(self.maximo, nota)
+        self.sketch.adicionar(nota)
+
+    def mesclar(self, outro):
+        # Combinação de Chan et al. para juntar resultados de arquivos diferentes
+        if outro.n == 0:
+            return
+        total = self.n + outro.n
+        delta = outro.media - self.media
+        self.m2 += outro.m2 + delta * delta * self.n * outro.n / total
+        self.media += delta * outro.n / total
+        self.n = total
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self.sketch.mesclar(outro.sketch)
+
+    @property
+    def variancia(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def resumo(self, percentis=PERCENTIS_PADRAO):
+        return [self.n, self.media, self.variancia, self.minimo, self.maximo] + [
+            self.sketch.quantil(p / 100) for p in percentis
+        ]
+
+
+def ler_notas(caminho, por=None):
+    # Gera pares (grupo, nota) linha a linha, sem carregar o arquivo na memória
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            # Arquivo vazio, sem cabeçalho: não há notas
+            return
+        coluna_nota = cabecalho.index("nota")
+        coluna_grupo = cabecalho.index(por) if por else None
+
+        for linha in leitor:
+            if linha:
+                grupo = linha[coluna_grupo] if coluna_grupo is not None else "geral"
+                yield grupo, float(linha[coluna_nota])
+
+
+def processar_arquivo(argumentos):
+    # Estatísticas por grupo de um arquivo; a memória cresce com os grupos, não com as linhas
+    caminho, por = argumentos
+    grupos = {}
+    for grupo, nota in ler_notas(caminho, por):
+        estatisticas = grupos.get(grupo)
+        if estatisticas is None:
+            estatisticas = grupos[grupo] = Estatisticas()
+        estatisticas.adicionar(nota)
+    return grupos
+
+
+def processar_arquivos(caminhos, por=None, processos=1):
+    # Processa cada arquivo em um processo e mescla os resultados por grupo
+    tarefas = [(caminho, por) for caminho in caminhos]
+    if processos > 1 and len(tarefas) > 1:
+        with Pool(min(processos, len(tarefas))) as pool:
+            parciais = pool.imap_unordered(processar_arquivo, tarefas)
+            return _mesclar_grupos(parciais)
+    return _mesclar_grupos(map(processar_arquivo, tarefas))
+
+
+def _mesclar_grupos(parciais):
+    resultado = {}
+    for grupos in parciais:
+        for grupo, estatisticas in grupos.items():
+            if grupo in resultado:
+                resultado[grupo].mesclar(estatisticas)
+            else:
+                resultado[grupo] = estatisticas
+    return resultado
+
+
+def estatisticas_numpy(grupos, notas, percentis=PERCENTIS_PADRAO):
+    # Caminho vetorizado para dados já em memória: quantis exatos (interpolação linear)
+    notas = np.asarray(notas, dtype=np.float64)
+    if notas.shape[0] == 0:
+        return {}
+    chaves, inverso = np.unique(np.asarray(grupos), return_inverse=True)
+
+    contagem = np.bincount(inverso)
+    media = np.bincount(inverso, weights=notas) / contagem
+    desvio = notas - media[inverso]
+    m2 = np.bincount(inverso, weights=desvio * desvio)
+    variancia = np.divide(m2, contagem - 1, out=np.zeros_like(m2), where=contagem > 1)
+
+    ordenadas = notas[np.lexsort((notas, inverso))]
+    inicios = np.concatenate(([0], np.cumsum(contagem)[:-1]))
+    ultimos = inicios + contagem - 1
+
+    colunas = [contagem, media, variancia, ordenadas[inicios], ordenadas[ultimos]]
+    for p in percentis:
+        posicao = p / 100 * (contagem - 1)
+        abaixo = np.floor(posicao).astype(np.int64)
+        fracao = posicao - abaixo
+        inferior = ordenadas[inicios + abaixo]
+        superior = ordenadas[np.minimum(inicios + abaixo + 1, ultimos)]
+        colunas.append(inferior + fracao * (superior - inferior))
+
+    return {chave: list(valores) for chave, valores in zip(chaves.tolist(), zip(*(c.tolist() for c in colunas)))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calcula estatísticas de notas.")
+    parser.add_argument("arquivos", nargs="*", help="arquivos CSV com as notas")
+    parser.add_argument("--por", choices=["aluno", "turma"], help="agrupa os resultados por aluno ou turma")
+    parser.add_argument("--processos", type=int, default=1, help="processos para ler arquivos em paralelo")
+    parser.add_argument("--percentis", type=float, nargs="+", default=list(PERCENTIS_PADRAO))
+    parser.add_argument("--numpy", action="store_true", help="carrega tudo em memória e usa NumPy")
+    args = parser.parse_args()
+
+    if not args.arquivos:
+        nota1 = float(input("Digite a primeira nota: "))
+        nota2 = float(input("Digite a segunda nota: "))
+        nota3 = float(input("Digite a terceira nota: "))
+        media = (nota1 + nota2 + nota3) / 3
+        print("A média das notas é:", media)
+        return
+
+    if args.numpy:
+        if np is None:
+            raise SystemExit("A opção --numpy requer o NumPy instalado.")
+        grupos, notas = [], []
+        for grupo, nota in itertools.chain.from_iterable(ler_notas(caminho, args.por) for caminho in args.arquivos):
+            grupos.append(grupo)
+            notas.append(nota)
+        linhas = estatisticas_numpy(grupos, notas, args.percentis)
+    else:
+        resultado = processar_arquivos(args.arquivos, args.por, args.processos)
+        linhas = {grupo: estatisticas.resumo(args.percentis) for grupo, estatisticas in resultado.items()}
+
+    escritor = csv.writer(sys.stdout)
+    escritor.writerow(
+        [args.por or "grupo", "n", "media", "variancia", "minimo", "maximo"]
+        + [f"p{p:g}" for p in args.percentis]
+    )
+    for grupo in sorted(linhas):
+        n, *valores = linhas[grupo]
+        escritor.writerow([grupo, n] + [f"{valor:.4f}" for valor in valores])
+
+
+if __name__ == "__main__":
+    main()
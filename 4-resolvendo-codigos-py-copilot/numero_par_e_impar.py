@@ -1,4 +1,197 @@
 # Como entrada, o programa recebe um número e verifica se ele é par ou ímpar
-numero = int(input("Digite um número inteiro: "))
-resultado = "par" if numero % 2 == 0 else "ímpar"
-print(f"O número é {resultado}.")
+# Modo em massa: python numero_par_e_impar.py ARQUIVO [--binario --tipo int64] [--pares ARQ] [--impares ARQ]
+import argparse
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TAMANHO_BLOCO = 8 << 20
+
+# Tipos aceitos no modo binário e os códigos equivalentes do módulo array (sem NumPy)
+TIPOS_BINARIOS = {
+    "int8": "b", "uint8": "B", "int16": "h", "uint16": "H",
+    "int32": "i", "uint32": "I", "int64": "q", "uint64": "Q",
+}
+
+ESPACOS = b" \t\n\r\v\f"
+
+
+def classificar(numero):
+    return "par" if numero % 2 == 0 else "ímpar"
+
+
+def contar_binario(caminho, tipo="int64", tamanho_bloco=TAMANHO_BLOCO, saida_pares=None, saida_impares=None):
+    # Conta pares e ímpares em um arquivo de inteiros binários (little-endian)
+    pares = impares = 0
+
+    if np is not None:
+        dtype = np.dtype(tipo).newbyteorder("<")
+        itens_por_bloco = max(1, tamanho_bloco // dtype.itemsize)
+        dados = np.memmap(caminho, dtype=dtype, mode="r") if _tamanho(caminho) else np.empty(0, dtype)
+
+        for inicio in range(0, dados.shape[0], itens_por_bloco):
+            bloco = dados[inicio:inicio + itens_por_bloco]
+            impar = (bloco & 1).astype(bool)
+            quantidade_impares = int(np.count_nonzero(impar))
+            impares += quantidade_impares
+            pares += bloco.shape[0] - quantidade_impares
+            if saida_pares:
+                bloco[~impar].tofile(saida_pares)
+            if saida_impares:
+                bloco[impar].tofile(saida_impares)
+
+        return pares, impares
+
+    codigo = TIPOS_BINARIOS[tipo]
+    tamanho_item = array(codigo).itemsize
+    with open(caminho, "rb") as arquivo:
+        while bloco := arquivo.read(tamanho_bloco - tamanho_bloco % tamanho_item):
+            numeros = array(codigo)
+            numeros.frombytes(bloco)
+            numeros_impares = array(codigo, [numero for numero in numeros if numero & 1])
+            impares += len(numeros_impares)
+            pares += len(numeros) - len(numeros_impares)
+            if saida_impares:
+                numeros_impares.tofile(saida_impares)
+            if saida_pares:
+                array(codigo, [numero for numero in numeros if not numero & 1]).tofile(saida_pares)
+
+    return pares, impares
+
+
+def _tamanho(caminho):
+    with open(caminho, "rb") as arquivo:
+        return arquivo.seek(0, 2)
+
+
+def _ultimo_espaco(bloco):
+    # Procura primeiro só no fim do bloco, onde fica o número incompleto
+    inicio = max(0, len(bloco) - 4096)
+    while True:
+        corte = max(bloco.rfind(espaco, inicio) for espaco in ESPACOS)
+        if corte >= 0 or inicio == 0:
+            return corte
+        inicio = 0
+
+
+def _blocos_texto(arquivo, tamanho_bloco):
+    # Corta cada bloco no último espaço em branco e leva o número incompleto para o
+    # bloco seguinte: nunca corta um número ao meio, mesmo com o arquivo em uma só linha
+    resto = b""
+    while bloco := arquivo.read(tamanho_bloco):
+        bloco = resto + bloco
+        corte = _ultimo_espaco(bloco) + 1
+        resto = bloco[corte:]
+        if corte:
+            yield bloco[:corte]
+    if resto:
+        yield resto + b"\n"
+
+
+def _classificar_texto_numpy(bloco):
+    # Trabalha direto nos bytes: a paridade de um decimal é a do último dígito,
+    # então números de qualquer tamanho são classificados sem conversão para int
+    dados = np.frombuffer(bloco, dtype=np.uint8)
+    espaco = np.isin(dados, np.frombuffer(ESPACOS, dtype=np.uint8))
+    digito = (dados >= ord("0")) & (dados <= ord("9"))
+    sinal = (dados == ord("-")) | (dados == ord("+"))
+
+    inicio = ~espaco & np.concatenate(([True], espaco[:-1]))
+    fins = np.flatnonzero(~espaco[:-1] & espaco[1:])
+    if fins.shape[0] == 0:
+        return None
+
+    token = np.cumsum(inicio) - 1
+    invalido_no_meio = ~espaco & ~digito & ~(sinal & inicio)
+    invalido = np.bincount(token[invalido_no_meio], minlength=fins.shape[0]) > 0
+    invalido |= ~digito[fins]
+
+    impar = ~invalido & (dados[fins] & 1).astype(bool)
+    par = ~invalido & ~impar
+    return dados, espaco, token, fins, par, impar, invalido
+
+
+def _selecionar_tokens(dados, espaco, token, fins, selecionados):
+    # Bytes dos números escolhidos, cada um seguido de uma quebra de linha
+    mascara = ~espaco & selecionados[token]
+    mascara[fins[selecionados] + 1] = True
+    return np.where(espaco, ord("\n"), dados)[mascara].astype(np.uint8).tobytes()
+
+
+def contar_texto(caminho, tamanho_bloco=TAMANHO_BLOCO, saida_pares=None, saida_impares=None):
+    # Conta pares, ímpares e valores inválidos em um arquivo de inteiros em texto
+    pares = impares = invalidos = 0
+
+    with open(caminho, "rb") as arquivo:
+        for bloco in _blocos_texto(arquivo, tamanho_bloco):
+            if np is not None:
+                resultado = _classificar_texto_numpy(bloco)
+                if resultado is None:
+                    continue
+                dados, espaco, token, fins, par, impar, invalido = resultado
+                pares += int(np.count_nonzero(par))
+                impares += int(np.count_nonzero(impar))
+                invalidos += int(np.count_nonzero(invalido))
+                if saida_pares:
+                    saida_pares.write(_selecionar_tokens(dados, espaco, token, fins, par))
+                if saida_impares:
+                    saida_impares.write(_selecionar_tokens(dados, espaco, token, fins, impar))
+                continue
+
+            # Sem NumPy: converte cada número para int do Python, de qualquer tamanho
+            for texto in bloco.split():
+                try:
+                    numero = int(texto)
+                except ValueError:
+                    invalidos += 1
+                    continue
+                if numero & 1:
+                    impares += 1
+                    if saida_impares:
+                        saida_impares.write(texto + b"\n")
+                else:
+                    pares += 1
+                    if saida_pares:
+                        saida_pares.write(texto + b"\n")
+
+    return pares, impares, invalidos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classifica números como pares ou ímpares.")
+    parser.add_argument("arquivo", nargs="?", help="arquivo com inteiros (texto ou binário)")
+    parser.add_argument("--binario", action="store_true", help="o arquivo contém inteiros binários")
+    parser.add_argument("--tipo", choices=TIPOS_BINARIOS, default="int64", help="tipo dos inteiros binários")
+    parser.add_argument("--pares", help="grava os números pares neste arquivo")
+    parser.add_argument("--impares", help="grava os números ímpares neste arquivo")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="bytes lidos por bloco")
+    args = parser.parse_args()
+
+    if not args.arquivo:
+        numero = int(input("Digite um número inteiro: "))
+        print(f"O número é {classificar(numero)}.")
+        return
+
+    saida_pares = open(args.pares, "wb") if args.pares else None
+    saida_impares = open(args.impares, "wb") if args.impares else None
+    try:
+        if args.binario:
+            pares, impares = contar_binario(args.arquivo, args.tipo, args.bloco, saida_pares, saida_impares)
+            invalidos = 0
+        else:
+            pares, impares, invalidos = contar_texto(args.arquivo, args.bloco, saida_pares, saida_impares)
+    finally:
+        for saida in (saida_pares, saida_impares):
+            if saida:
+                saida.close()
+
+    print(f"Pares: {pares}\nÍmpares: {impares}")
+    if invalidos:
+        print(f"Inválidos: {invalidos}")
+
+
+if __name__ == "__main__":
+    main()
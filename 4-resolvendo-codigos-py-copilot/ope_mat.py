@@ -1,22 +1,256 @@
 #vamos solicitar como entrada dois números inteiros e realizar a operação de soma entre eles
-num1 = int(input("Digite o primeiro número inteiro: ")) 
-num2 = int(input("Digite o segundo número inteiro: "))
-operacao = input("Escolha a operação (+, -, *, /): ")
-
-if operacao == "+":
-    resultado = num1 + num2
-    print("Resultado da soma:", resultado)
-elif operacao == "-":
-    resultado = num1 - num2
-    print("Resultado da subtração:", resultado)
-elif operacao == "*":
-    resultado = num1 * num2
-    print("Resultado da multiplicação:", resultado)
-elif operacao == "/":
-    if num2 != 0:
-        resultado = num1 / num2
-        print("Resultado da divisão:", resultado)
+#Modo em lote: python ope_mat.py --lote ENTRADA.csv [--saida SAIDA.csv] [--operacao +]
+import argparse
+import contextlib
+import sys
+import time
+import warnings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NOMES = {"+": "soma", "-": "subtração", "*": "multiplicação", "/": "divisão"}
+
+OPERACOES = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b if b != 0 else None,
+}
+
+# Formato binário: registros de dois int64 seguidos do operador em um byte
+TIPO_BINARIO = [("num1", "<i8"), ("num2", "<i8"), ("operacao", "S1")]
+
+# Saída binária: resultado inteiro (+ - *), resultado real (/) e se a linha é válida
+TIPO_RESULTADO = [("inteiro", "<i8"), ("real", "<f8"), ("valido", "?")]
+
+MENOR_INT64 = -(1 << 63)
+
+
+# Cada operação vetorizada retorna o resultado e a máscara das linhas válidas.
+# + - * ficam em int64, exatos como no modo escalar; linhas que estouram o int64 são inválidas
+def _somar(a, b):
+    resultado = a + b
+    return resultado, ((a ^ resultado) & (b ^ resultado)) >= 0
+
+
+def _subtrair(a, b):
+    resultado = a - b
+    return resultado, ((a ^ b) & (a ^ resultado)) >= 0
+
+
+def _cabe_em_bits(a, bits):
+    # True onde o int64 cabe em um inteiro com sinal de ``bits`` bits
+    return (a.view(np.uint64) + np.uint64(1 << (bits - 1))) < np.uint64(1 << bits)
+
+
+def _multiplicar(a, b):
+    resultado = a * b
+    validos = _cabe_em_bits(a, 32) & _cabe_em_bits(b, 32)
+
+    # Só operandos fora de 32 bits podem estourar: sem estouro, o produto dividido por a devolve b
+    grandes = np.flatnonzero(~validos)
+    if grandes.shape[0]:
+        a_grande, b_grande = a[grandes], b[grandes]
+        with np.errstate(over="ignore", divide="ignore"):
+            volta = resultado[grandes] // np.where(a_grande != 0, a_grande, 1)
+        validos[grandes] = (a_grande == 0) | ((volta == b_grande) & ~((a_grande == -1) & (b_grande == MENOR_INT64)))
+    return resultado, validos
+
+
+def _dividir(a, b):
+    # Só a divisão usa float64; divisor zero marca a linha como inválida
+    validos = b != 0
+    resultado = np.divide(a, b, out=np.zeros(a.shape), where=validos)
+
+    # Operandos acima de 2^52 não cabem exatos no float64: essas linhas usam a divisão
+    # de inteiros do Python, que arredonda o quociente exato como no modo escalar
+    grandes = np.flatnonzero(validos & ~(_cabe_em_bits(a, 53) & _cabe_em_bits(b, 53)))
+    if grandes.shape[0]:
+        resultado[grandes] = [x / y for x, y in zip(a[grandes].tolist(), b[grandes].tolist())]
+    return resultado, validos
+
+
+def _operacoes_vetorizadas():
+    return {
+        "+": _somar,
+        "-": _subtrair,
+        "*": _multiplicar,
+        "/": _dividir,
+    }
+
+
+def _codigos(operacoes):
+    # Código numérico de cada operador, para comparar números em vez de strings
+    return operacoes.view(np.uint32) if operacoes.dtype.kind == "U" else operacoes.view(np.uint8)
+
+
+def calcular_lote(num1, num2, operacoes):
+    # Aplica os operadores sobre os arrays; retorna resultados inteiros (+ - *),
+    # resultados reais (/), a máscara das divisões e a máscara de linhas válidas
+    tabela = _operacoes_vetorizadas()
+    num1 = num1.astype(np.int64)
+    num2 = num2.astype(np.int64)
+
+    if isinstance(operacoes, str):
+        resultado, validos = tabela[operacoes](num1, num2)
+        divisao = np.full(num1.shape, operacoes == "/")
+        if operacoes == "/":
+            return np.zeros(num1.shape, dtype=np.int64), resultado, divisao, validos
+        return resultado, np.zeros(num1.shape), divisao, validos
+
+    # Agrupa as linhas pelo código do operador e aplica cada função da tabela só ao seu grupo;
+    # operadores desconhecidos não entram em nenhum grupo e ficam inválidos
+    codigos = _codigos(operacoes)
+    inteiros = np.zeros(num1.shape, dtype=np.int64)
+    reais = np.zeros(num1.shape)
+    validos = np.zeros(num1.shape, dtype=bool)
+    divisao = codigos == ord("/")
+
+    for simbolo, funcao in tabela.items():
+        indices = np.flatnonzero(divisao if simbolo == "/" else codigos == ord(simbolo))
+        if indices.shape[0] == 0:
+            continue
+        resultado, validos[indices] = funcao(num1[indices], num2[indices])
+        (reais if simbolo == "/" else inteiros)[indices] = resultado
+
+    return inteiros, reais, divisao, validos
+
+
+def _texto(inteiros, reais, divisao, validos):
+    # Uma linha por operação: inteiros exatos, divisões como no modo escalar e "nan" para inválidas;
+    # só as linhas de divisão e as inválidas são reescritas depois da conversão dos inteiros
+    linhas = list(map(str, inteiros.tolist()))
+    indices = np.flatnonzero(divisao & validos).tolist()
+    for indice, real in zip(indices, map(str, reais[indices].tolist())):
+        linhas[indice] = real
+    for indice in np.flatnonzero(~validos).tolist():
+        linhas[indice] = "nan"
+    linhas.append("")
+    return "\n".join(linhas)
+
+
+def ler_csv(caminho, tamanho_bloco, operacao=None):
+    # Lê o CSV em blocos: "num1,num2,operacao" ou só "num1,num2" com --operacao
+    if operacao:
+        tipo = [("num1", "<i8"), ("num2", "<i8")]
     else:
+        tipo = [("num1", "<i8"), ("num2", "<i8"), ("operacao", "U1")]
+
+    with open(caminho, encoding="utf-8") as arquivo, warnings.catch_warnings():
+        # O último bloco vazio sinaliza o fim do arquivo; o aviso do NumPy é esperado
+        warnings.simplefilter("ignore", UserWarning)
+        while True:
+            bloco = np.loadtxt(arquivo, delimiter=",", dtype=tipo, max_rows=tamanho_bloco, ndmin=1)
+            if bloco.size == 0:
+                break
+            yield bloco["num1"], bloco["num2"], operacao or bloco["operacao"]
+
+
+def ler_binario(caminho, tamanho_bloco):
+    # Mapeia o arquivo em memória e entrega fatias sem copiar o arquivo inteiro
+    registros = np.memmap(caminho, dtype=TIPO_BINARIO, mode="r")
+    for inicio in range(0, registros.shape[0], tamanho_bloco):
+        bloco = registros[inicio:inicio + tamanho_bloco]
+        yield bloco["num1"], bloco["num2"], bloco["operacao"]
+
+
+def processar_lote(entrada, saida, tamanho_bloco=1_000_000, operacao=None):
+    # Processa o arquivo em blocos e escreve os resultados à medida que saem
+    if np is None:
+        raise SystemExit("O modo em lote requer o NumPy instalado.")
+
+    if entrada.endswith(".bin"):
+        blocos = ler_binario(entrada, tamanho_bloco)
+    else:
+        blocos = ler_csv(entrada, tamanho_bloco, operacao)
+
+    binario = saida != "-" and saida.endswith(".bin")
+    if saida == "-":
+        destino = contextlib.nullcontext(sys.stdout)
+    elif binario:
+        destino = open(saida, "wb")
+    else:
+        destino = open(saida, "w", encoding="utf-8")
+    total = invalidos = 0
+
+    with destino as arquivo:
+        for num1, num2, operacoes in blocos:
+            inteiros, reais, divisao, validos = calcular_lote(num1, num2, operacoes)
+            total += validos.shape[0]
+            invalidos += int((~validos).sum())
+
+            if binario:
+                registros = np.empty(validos.shape[0], dtype=TIPO_RESULTADO)
+                registros["inteiro"], registros["real"], registros["valido"] = inteiros, reais, validos
+                registros.tofile(arquivo)
+            else:
+                arquivo.write(_texto(inteiros, reais, divisao, validos))
+
+    return total, invalidos
+
+
+def benchmark(quantidade=1_000_000):
+    # Compara o laço escalar com a versão vetorizada sobre operandos aleatórios
+    if np is None:
+        raise SystemExit("O benchmark requer o NumPy instalado.")
+
+    gerador = np.random.default_rng(42)
+    num1 = gerador.integers(-1000, 1000, quantidade)
+    num2 = gerador.integers(-10, 10, quantidade)
+    operacoes = gerador.choice(list(OPERACOES), quantidade)
+
+    lista1, lista2, lista_operacoes = num1.tolist(), num2.tolist(), operacoes.tolist()
+    inicio = time.perf_counter()
+    escalar = [OPERACOES[op](a, b) for a, b, op in zip(lista1, lista2, lista_operacoes)]
+    tempo_escalar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    calcular_lote(num1, num2, operacoes)
+    tempo_vetorizado = time.perf_counter() - inicio
+
+    print(f"Escalar:\t{quantidade / tempo_escalar:>14,.0f} pares/s ({escalar.count(None)} divisões por zero)")
+    print(f"Vetorizado:\t{quantidade / tempo_vetorizado:>14,.0f} pares/s")
+    print(f"Ganho:\t\t{tempo_escalar / tempo_vetorizado:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculadora de + - * / com modo em lote.")
+    parser.add_argument("--lote", metavar="ENTRADA", help="arquivo .csv ou .bin com os operandos")
+    parser.add_argument("--saida", default="-", help="arquivo de saída (.bin para binário); padrão: stdout")
+    parser.add_argument("--operacao", choices=OPERACOES, help="operador único quando o CSV tem só dois campos")
+    parser.add_argument("--bloco", type=int, default=1_000_000, help="linhas por bloco")
+    parser.add_argument("--benchmark", action="store_true", help="compara o laço escalar com o vetorizado")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+
+    if args.lote:
+        total, invalidos = processar_lote(args.lote, args.saida, args.bloco, args.operacao)
+        print(
+            f"{total} operações, {invalidos} inválidas (divisão por zero, operador desconhecido ou estouro do int64).",
+            file=sys.stderr,
+        )
+        return
+
+    num1 = int(input("Digite o primeiro número inteiro: "))
+    num2 = int(input("Digite o segundo número inteiro: "))
+    operacao = input("Escolha a operação (+, -, *, /): ")
+
+    if operacao not in OPERACOES:
+        print("Operação inválida.")
+        return
+
+    resultado = OPERACOES[operacao](num1, num2)
+    if resultado is None:
         print("Não é possível dividir por zero.")
-else:
-    print("Operação inválida.")
\ No newline at end of file
+    else:
+        print(f"Resultado da {NOMES[operacao]}:", resultado)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,179 @@
 #Faça um programa que verifique se uma palavra é um palíndromo
-palavra = input("Digite uma palavra: ")
+#Também verifica arquivos grandes linha a linha: python palindromo.py ARQUIVO [--normalizar] [--processos N]
+#No modo arquivo a estratégia padrão é sem_copia, que não cria cópias da linha; "hibrido" e
+#"fatia" são mais rápidas, mas copiam metade ou toda a linha quando as pontas coincidem
+import argparse
+import os
+import sys
+import time
+import unicodedata
+from multiprocessing import Pool
+
 
 def eh_palindromo(palavra):
-    if palavra == palavra[::-1]:
-        print(f"A palavra '{palavra}' é um palíndromo.")
-    else:
-        print(f"A palavra '{palavra}' não é um palíndromo.")
+    return palavra == palavra[::-1]
+
 
 def eh_palindromo_string(palavra):
     invertida = ''.join(reversed(palavra))
-    if palavra == invertida:
-        print(f"(NEW) A palavra '{palavra}' é um palíndromo.")
+    return palavra == invertida
+
+
+def eh_palindromo_sem_copia(palavra):
+    # Compara as pontas em direção ao centro, sem criar a palavra invertida
+    fim = len(palavra) - 1
+    if fim > 0 and palavra[0] != palavra[fim]:
+        return False
+    for inicio in range(1, len(palavra) // 2):
+        if palavra[inicio] != palavra[fim - inicio]:
+            return False
+    return True
+
+
+def eh_palindromo_hibrido(palavra):
+    # A maioria das linhas já difere nas pontas: só compara metades se elas batem,
+    # criando uma cópia invertida da segunda metade
+    tamanho = len(palavra)
+    if tamanho < 2:
+        return True
+    if palavra[0] != palavra[-1]:
+        return False
+    metade = tamanho // 2
+    return palavra[:metade] == palavra[:-metade - 1:-1]
+
+
+ESTRATEGIAS = {
+    "fatia": eh_palindromo,
+    "reversed": eh_palindromo_string,
+    "sem_copia": eh_palindromo_sem_copia,
+    "hibrido": eh_palindromo_hibrido,
+}
+
+
+def normalizar(texto, caixa=True, acentos=True, pontuacao=True):
+    if acentos:
+        texto = ''.join(c for c in unicodedata.normalize("NFD", texto) if not unicodedata.combining(c))
+    if caixa:
+        texto = texto.casefold()
+    if pontuacao:
+        texto = ''.join(c for c in texto if c.isalnum())
+    return texto
+
+
+def filtrar_palindromos(linhas, normalizado=False, estrategia="sem_copia"):
+    # Gera as linhas (sem quebra de linha) que são palíndromos
+    verificar = ESTRATEGIAS[estrategia]
+    for linha in linhas:
+        linha = linha.rstrip("\r\n")
+        if verificar(normalizar(linha) if normalizado else linha):
+            yield linha
+
+
+def _contar_trecho(argumentos):
+    # Conta as linhas que começam dentro de [inicio, fim) do arquivo
+    caminho, inicio, fim, normalizado, estrategia = argumentos
+    verificar = ESTRATEGIAS[estrategia]
+    total = palindromos = 0
+
+    with open(caminho, "rb", buffering=1 << 20) as arquivo:
+        if inicio > 0:
+            arquivo.seek(inicio - 1)
+            arquivo.readline()
+        posicao = arquivo.tell()
+
+        while posicao < fim:
+            bruta = arquivo.readline()
+            if not bruta:
+                break
+            posicao += len(bruta)
+
+            linha = bruta.decode("utf-8", errors="replace").rstrip("\r\n")
+            if normalizado:
+                linha = normalizar(linha)
+            total += 1
+            palindromos += verificar(linha)
+
+    return total, palindromos
+
+
+def contar_palindromos_arquivo(caminho, normalizado=False, processos=1, estrategia="sem_copia"):
+    # Divide o arquivo em trechos de bytes e conta cada trecho em um processo
+    tamanho = os.path.getsize(caminho)
+    processos = max(1, min(processos, tamanho // (1 << 20) or 1))
+    passo = -(-tamanho // processos)
+    trechos = [
+        (caminho, inicio, min(inicio + passo, tamanho), normalizado, estrategia)
+        for inicio in range(0, tamanho, passo)
+    ] or [(caminho, 0, 0, normalizado, estrategia)]
+
+    if len(trechos) == 1:
+        resultados = [_contar_trecho(trechos[0])]
+    else:
+        with Pool(len(trechos)) as pool:
+            resultados = pool.map(_contar_trecho, trechos)
+
+    return sum(r[0] for r in resultados), sum(r[1] for r in resultados)
+
+
+def benchmark(quantidade=1_000_000):
+    # Compara as estratégias sobre um corpus sintético com palavras comuns e palíndromos
+    base = ["arara", "socorram-me subi no onibus em marrocos", "python", "reviver", "bootcamp", "abcdefghij" * 4]
+    corpus = [
+        (palavra + palavra[::-1]) if indice % 10 == 0 else palavra
+        for indice, palavra in zip(range(quantidade), base * (quantidade // len(base) + 1))
+    ]
+
+    for nome, verificar in ESTRATEGIAS.items():
+        inicio = time.perf_counter()
+        encontrados = sum(1 for linha in corpus if verificar(linha))
+        segundos = time.perf_counter() - inicio
+        print(f"{nome:10}\t{quantidade / segundos:>14,.0f} linhas/s\t({encontrados} palíndromos)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica palíndromos em uma palavra ou em um arquivo.")
+    parser.add_argument("arquivo", nargs="?", help="arquivo de texto; '-' lê da entrada padrão")
+    parser.add_argument("--normalizar", action="store_true", help="ignora maiúsculas, acentos e pontuação")
+    parser.add_argument("--processos", type=int, default=1, help="processos para dividir o arquivo")
+    parser.add_argument("--listar", action="store_true", help="imprime as linhas que são palíndromos")
+    parser.add_argument(
+        "--estrategia",
+        choices=ESTRATEGIAS,
+        default="sem_copia",
+        help="sem_copia (padrão) não copia a linha; hibrido copia metade dela e fatia/reversed a linha inteira",
+    )
+    parser.add_argument("--benchmark", action="store_true", help="compara as estratégias")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+
+    elif args.arquivo == "-" or (args.arquivo and args.listar):
+        entrada = sys.stdin if args.arquivo == "-" else open(args.arquivo, encoding="utf-8", errors="replace")
+        with entrada:
+            saida = filtrar_palindromos(entrada, args.normalizar, args.estrategia)
+            if args.listar:
+                sys.stdout.writelines(linha + "\n" for linha in saida)
+            else:
+                print(f"Palíndromos: {sum(1 for _ in saida)}")
+
+    elif args.arquivo:
+        total, palindromos = contar_palindromos_arquivo(
+            args.arquivo, args.normalizar, args.processos, args.estrategia
+        )
+        print(f"Linhas: {total}\nPalíndromos: {palindromos}")
+
     else:
-        print(f"(NEW) A palavra '{palavra}' não é um palíndromo.")
+        palavra = input("Digite uma palavra: ")
+        if eh_palindromo(palavra):
+            print(f"A palavra '{palavra}' é um palíndromo.")
+        else:
+            print(f"A palavra '{palavra}' não é um palíndromo.")
+        if eh_palindromo_string(palavra):
+            print(f"(NEW) A palavra '{palavra}' é um palíndromo.")
+        else:
+            print(f"(NEW) A palavra '{palavra}' não é um palíndromo.")
 
-eh_palindromo(palavra)
-eh_palindromo_string(palavra)
 
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,73 @@
-texto = input("Digite um texto: ")
-numero = int(input("Digite um número inteiro: "))
+#Repete um texto N vezes, escrevendo em blocos para não montar a string inteira na memória
+#Uso: python repet_txt.py [--texto T --numero N] [--saida ARQUIVO] [--benchmark]
+import argparse
+import itertools
+import sys
+import tempfile
+import time
 
-resultado = (texto + " ") * numero
-print(resultado)
\ No newline at end of file
+TAMANHO_BLOCO = 1 << 20
+
+
+def escrever_repeticao(texto, numero, destino, tamanho_bloco=TAMANHO_BLOCO):
+    # Monta um bloco dobrando a unidade até ~tamanho_bloco e o reaproveita em todas as escritas
+    unidade = (texto + " ").encode("utf-8")
+    bloco = unidade
+    repeticoes = 1
+    while len(bloco) * 2 <= tamanho_bloco and repeticoes * 2 <= numero:
+        bloco += bloco
+        repeticoes *= 2
+
+    completos, resto = divmod(max(numero, 0), repeticoes)
+    visao = memoryview(bloco)
+    destino.writelines(itertools.repeat(visao, completos))
+    destino.write(visao[:resto * len(unidade)])
+    destino.write(b"\n")
+    return completos * len(bloco) + resto * len(unidade) + 1
+
+
+def benchmark(texto="bootcamp python", numero=20_000_000):
+    # Mede a vazão em MB/s gravando em um arquivo temporário, contra montar a string inteira
+    with tempfile.TemporaryFile() as arquivo:
+        inicio = time.perf_counter()
+        escritos = escrever_repeticao(texto, numero, arquivo)
+        arquivo.flush()
+        segundos = time.perf_counter() - inicio
+    print(f"Em blocos:\t{escritos / segundos / 1e6:>8,.0f} MB/s ({escritos / 1e6:,.0f} MB)")
+
+    with tempfile.TemporaryFile("w", encoding="utf-8") as arquivo:
+        inicio = time.perf_counter()
+        resultado = (texto + " ") * numero
+        print(resultado, file=arquivo)
+        arquivo.flush()
+        segundos = time.perf_counter() - inicio
+    print(f"String única:\t{len(resultado) / segundos / 1e6:>8,.0f} MB/s ({len(resultado) / 1e6:,.0f} MB em memória)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repete um texto N vezes.")
+    parser.add_argument("--texto", help="texto a repetir (senão é perguntado)")
+    parser.add_argument("--numero", type=int, help="quantidade de repetições (senão é perguntada)")
+    parser.add_argument("--saida", help="arquivo de saída; padrão: saída padrão")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="tamanho aproximado de cada escrita em bytes")
+    parser.add_argument("--benchmark", action="store_true", help="mede a vazão em MB/s")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+
+    texto = args.texto if args.texto is not None else input("Digite um texto: ")
+    numero = args.numero if args.numero is not None else int(input("Digite um número inteiro: "))
+
+    if args.saida:
+        with open(args.saida, "wb") as arquivo:
+            escrever_repeticao(texto, numero, arquivo, args.bloco)
+    else:
+        sys.stdout.flush()
+        escrever_repeticao(texto, numero, sys.stdout.buffer, args.bloco)
+        sys.stdout.buffer.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,36 @@
+import argparse
+import contextlib
+import io
 import textwrap
+import time
+
+
+class Extrato:
+    """Livro-razão de uma conta: lançamentos estruturados, texto gerado só na exibição."""
+
+    FORMATOS = {
+        "Depósito": "Depósito:\tR$ {:.2f}\n",
+        "Saque": "Saque:\t\tR$ {:.2f}\n",
+    }
+
+    def __init__(self):
+        self.lancamentos = []
+        self._linhas = []
+
+    def registrar(self, tipo, valor):
+        self.lancamentos.append((tipo, valor))
+
+    def __len__(self):
+        return len(self.lancamentos)
+
+    def __bool__(self):
+        return bool(self.lancamentos)
+
+    def __str__(self):
+        # Formata apenas os lançamentos novos desde a última exibição
+        for tipo, valor in self.lancamentos[len(self._linhas):]:
+            self._linhas.append(self.FORMATOS[tipo].format(valor))
+        return "".join(self._linhas)
 
 
 def menu():
@@ -18,7 +50,7 @@ def menu():
 def depositar(saldo, valor, extrato, /):
     if valor > 0:
         saldo += valor
-        extrato += f"Depósito:\tR$ {valor:.2f}\n"
+        extrato.registrar("Depósito", valor)
         print("\n=== Depósito realizado com sucesso! ===")
     else:
         print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
@@ -42,7 +74,7 @@ def sacar(*, saldo, valor, extrato, limite, numero_saques, limite_saques):
 
     elif valor > 0:
         saldo -= valor
-        extrato += f"Saque:\t\tR$ {valor:.2f}\n"
+        extrato.registrar("Saque", valor)
         numero_saques += 1
         print("\n=== Saque realizado com sucesso! ===")
 
@@ -87,53 +119,81 @@ def criar_conta(agencia, numero_conta, usuarios):
 
     if usuario:
         print("\n=== Conta criada com sucesso! ===")
-        return {"agencia": agencia, "numero_conta": numero_conta, "usuario": usuario}
+        return {
+            "agencia": agencia,
+            "numero_conta": numero_conta,
+            "usuario": usuario,
+            "saldo": 0,
+            "extrato": Extrato(),
+            "numero_saques": 0,
+        }
 
     print("\n@@@ Usuário não encontrado, fluxo de criação de conta encerrado! @@@")
 
 
-def listar_contas(contas):
-    for conta in contas:
-        linha = f"""\
-            Agencia:\t{conta['agencia']}
-            C/C:\t\t{conta['numero_conta']}
-            Titular:\t{conta['usuario']['nome']}
-        """
-        print("=" * 100)
-        print(textwrap.dedent(linha))
+def recuperar_conta(contas):
+    try:
+        numero_conta = int(input("Informe o número da conta: "))
+    except ValueError:
+        numero_conta = 0
+
+    if 1 <= numero_conta <= len(contas):
+        return contas[numero_conta - 1]
+
+    print("\n@@@ Conta não encontrada! @@@")
+
+
+def listar_contas(contas, tamanho_pagina=20):
+    for inicio in range(0, len(contas), tamanho_pagina):
+        linhas = []
+        for conta in contas[inicio:inicio + tamanho_pagina]:
+            linha = f"""\
+                Agencia:\t{conta['agencia']}
+                C/C:\t\t{conta['numero_conta']}
+                Titular:\t{conta['usuario']['nome']}
+            """
+            linhas.append("=" * 100)
+            linhas.append(textwrap.dedent(linha))
+        print("\n".join(linhas))
+
+        ultima_pagina = inicio + tamanho_pagina >= len(contas)
+        if ultima_pagina or input("[Enter] próxima página, [q] voltar: ").strip().lower() == "q":
+            break
 
 
 def main():
     LIMITE_SAQUES = 3
     AGENCIA = "0001"
 
-    saldo = 0
     limite = 500
-    extrato = ""
-    numero_saques = 0
     usuarios = []
     contas = []
 
     while True:
         opcao = menu()
 
+        if opcao in ("d", "s", "e"):
+            conta = recuperar_conta(contas)
+            if not conta:
+                continue
+
         if opcao == "d":
             valor = float(input("Informe o valor do depósito: "))
-            saldo, extrato = depositar(saldo, valor, extrato)
+            conta["saldo"], conta["extrato"] = depositar(conta["saldo"], valor, conta["extrato"])
 
         elif opcao == "s":
             valor = float(input("Informe o valor do saque: "))
-            saldo, extrato, numero_saques = sacar(
-                saldo=saldo,
+            conta["saldo"], conta["extrato"], conta["numero_saques"] = sacar(
+                saldo=conta["saldo"],
                 valor=valor,
-                extrato=extrato,
+                extrato=conta["extrato"],
                 limite=limite,
-                numero_saques=numero_saques,
+                numero_saques=conta["numero_saques"],
                 limite_saques=LIMITE_SAQUES,
             )
 
         elif opcao == "e":
-            exibir_extrato(saldo, extrato=extrato)
+            exibir_extrato(conta["saldo"], extrato=conta["extrato"])
 
         elif opcao == "nu":
             criar_usuario(usuarios)
@@ -155,4 +215,36 @@ def main():
             print("Operação inválida, por favor selecione novamente a operação desejada.")
 
 
-main()
+def benchmark(tamanhos=(1_000, 10_000, 100_000, 1_000_000), amostra=10_000):
+    # Custo médio de um depósito com o histórico já em cada tamanho: livro-razão x string
+    def depositar_em_string(saldo, valor, extrato, /):
+        saldo += valor
+        extrato += f"Depósito:\tR$ {valor:.2f}\n"
+        return saldo, extrato
+
+    for tamanho in tamanhos:
+        saldo, extrato = 0, Extrato()
+        texto = "Depósito:\tR$ 1.00\n" * tamanho
+        extrato.lancamentos = [("Depósito", 1.0)] * tamanho
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            for _ in range(amostra):
+                saldo, extrato = depositar(saldo, 1.0, extrato)
+            custo_livro = (time.perf_counter() - inicio) / amostra
+
+        inicio = time.perf_counter()
+        for _ in range(min(amostra, 200)):
+            saldo, texto = depositar_em_string(saldo, 1.0, texto)
+        custo_string = (time.perf_counter() - inicio) / min(amostra, 200)
+
+        print(f"{tamanho:>9} lançamentos:\tlivro-razão {custo_livro * 1e6:6.2f} µs\tstring {custo_string * 1e6:9.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sistema bancário com extrato por conta.")
+    parser.add_argument("--benchmark", action="store_true", help="mede o custo de um lançamento conforme o histórico cresce")
+    if parser.parse_args().benchmark:
+        benchmark()
+    else:
+        main()